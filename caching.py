@@ -0,0 +1,58 @@
+"""
+caching.py
+----------
+On-disk cache for integrated trajectories, shared by manim_scenes.py and
+static_plots.py (no manim import, so the notebook helpers can use it).
+"""
+
+import functools
+import hashlib
+import inspect
+import os
+from pathlib import Path
+
+import numpy as np
+
+CACHE_DIR = Path(__file__).resolve().parent / ".cache"
+
+
+def disk_cache(name: str, mmap: bool = False):
+    """
+    Persist a function's result under .cache/ so integrations survive between
+    runs and notebook restarts. The hash covers the call arguments and the
+    source of the whole module defining the function, so editing it or
+    anything it calls (right-hand sides, RK4 kernels, Jacobians, solver
+    settings) invalidates its entries.
+
+    By default the function returns a tuple of arrays, stored as
+    <name>_<hash>.npz. With mmap=True it returns a single array, stored as
+    <name>_<hash>.npy and memory-mapped on load. Returned arrays are read-only.
+    """
+    suffix = ".npy" if mmap else ".npz"
+
+    def decorator(func):
+        source = hashlib.sha1(Path(inspect.getsourcefile(func)).read_bytes()).hexdigest()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = repr((args, sorted(kwargs.items()), source))
+            path = CACHE_DIR / f"{name}_{hashlib.sha1(key.encode()).hexdigest()[:16]}{suffix}"
+            if not path.exists():
+                CACHE_DIR.mkdir(exist_ok=True)
+                tmp_path = path.with_suffix(".tmp" + suffix)
+                if mmap:
+                    np.save(tmp_path, func(*args, **kwargs))
+                else:
+                    np.savez(tmp_path, *(np.asarray(arr) for arr in func(*args, **kwargs)))
+                os.replace(tmp_path, path)
+            if mmap:
+                return np.load(path, mmap_mode="r")
+            with np.load(path) as data:
+                result = tuple(data[f"arr_{i}"] for i in range(len(data.files)))
+            for arr in result:
+                arr.setflags(write=False)
+            return result
+
+        return wrapper
+
+    return decorator
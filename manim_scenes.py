@@ -11,54 +11,232 @@ Run examples:
     manim -pqh manim_scenes.py LorenzAttractorScene
 """
 
+import functools
+
 from manim import *
 import numpy as np
+from numba import njit
 from scipy.integrate import solve_ivp
 
+from caching import disk_cache
+
+# ---------------------------------------------------------------------------
+# Coordinate helpers
+# ---------------------------------------------------------------------------
+
+def c2p_batch(axes, pts):
+    """
+    Vectorized axes.c2p for an (N, d) array of coordinates.
+    Axes map coordinates affinely, so the origin and unit vectors are probed
+    once and every point is mapped with a single matrix product.
+    The map is evaluated in float64; the scene points are returned as
+    float32, which is ample precision for drawing and halves their size.
+    """
+    pts = np.asarray(pts, dtype=np.float64)
+    dim = pts.shape[1]
+    origin = np.asarray(axes.c2p(*np.zeros(dim)))
+    basis = np.stack([np.asarray(axes.c2p(*unit)) - origin for unit in np.eye(dim)])
+    return (pts @ basis + origin).astype(np.float32)
+
+
+def make_curve(points, smooth=False, max_pts=600):
+    """
+    Build a VMobject through `points`, uniformly subsampled to at most
+    `max_pts` anchors. Piecewise-linear by default; smooth=True fits cubic
+    Bézier handles, which is much more expensive per anchor.
+    """
+    pts = np.asarray(points)
+    if len(pts) > max_pts:
+        pts = pts[np.linspace(0, len(pts) - 1, max_pts).astype(int)]
+    curve = VMobject()
+    if smooth:
+        curve.set_points_smoothly(pts)
+    else:
+        curve.set_points_as_corners(pts)
+    return curve
+
+
+def decimate(points, eps=0.01):
+    """
+    Ramer-Douglas-Peucker simplification of an (N, d) polyline: drop every
+    point lying within `eps` of the segment between the points kept on
+    either side of it. Endpoints are always kept. With scene points, the
+    default eps is about one pixel at 1080p.
+    """
+    pts = np.asarray(points)
+    if len(pts) <= 2:
+        return pts
+    keep = np.zeros(len(pts), dtype=bool)
+    keep[[0, -1]] = True
+    stack = [(0, len(pts) - 1)]
+    while stack:
+        i, j = stack.pop()
+        if j - i < 2:
+            continue
+        offsets = pts[i + 1:j] - pts[i]
+        chord = pts[j] - pts[i]
+        chord_sq = float(chord @ chord)
+        along = np.clip(offsets @ chord / chord_sq, 0.0, 1.0) if chord_sq > 0 else np.zeros(j - i - 1)
+        dist = np.linalg.norm(offsets - along[:, None] * chord, axis=1)
+        k = int(np.argmax(dist))
+        if dist[k] > eps:
+            mid = i + 1 + k
+            keep[mid] = True
+            stack.append((i, mid))
+            stack.append((mid, j))
+    return pts[keep]
+
+
+def smooth_points(points):
+    """
+    Bézier control points that set_points_smoothly would produce for
+    `points`, so a curve can be smoothed once and later restored with the
+    plain set_points setter.
+    """
+    return VMobject().set_points_smoothly(points).points.copy()
+
+
+def make_segments(starts, ends):
+    """
+    Build one VMobject made of the straight segments starts[i] → ends[i],
+    given as (K, 3) arrays of scene points. Each segment is written directly
+    as a degenerate cubic Bézier; segments that do not touch become separate
+    subpaths, so this replaces a VGroup of K Line mobjects.
+    """
+    starts = np.asarray(starts)
+    ends = np.asarray(ends)
+    t = np.array([0.0, 1 / 3, 2 / 3, 1.0], dtype=starts.dtype)[None, :, None]
+    segments = VMobject()
+    segments.set_points((starts[:, None, :] + t * (ends - starts)[:, None, :]).reshape(-1, 3))
+    return segments
+
+
+# Unit circle as four cubic Bézier quarter arcs (16 control points)
+_K = 4 / 3 * (np.sqrt(2) - 1)
+_UNIT_CIRCLE = np.array([
+    [1, 0], [1, _K], [_K, 1], [0, 1],
+    [0, 1], [-_K, 1], [-1, _K], [-1, 0],
+    [-1, 0], [-1, -_K], [-_K, -1], [0, -1],
+    [0, -1], [_K, -1], [1, -_K], [1, 0],
+], dtype=np.float64)
+
+
+def make_dot_cloud(centers, radius=0.01, color=WHITE, opacity=1.0):
+    """
+    Build one filled VMobject holding a small disc at every row of the
+    (N, 3) array of scene points `centers`. Each disc is a separate subpath
+    of a single points array, so this replaces a VGroup of N Dot mobjects.
+    """
+    centers = np.asarray(centers)
+    circle = np.zeros((16, 3), dtype=centers.dtype)
+    circle[:, :2] = radius * _UNIT_CIRCLE
+    cloud = VMobject(stroke_width=0)
+    cloud.set_points((centers[:, None, :] + circle[None, :, :]).reshape(-1, 3))
+    cloud.set_fill(color, opacity=opacity)
+    return cloud
+
+
 # ---------------------------------------------------------------------------
 # Van der Pol helpers
 # ---------------------------------------------------------------------------
 
+@njit(cache=True)
+def _van_der_pol_rhs(t, state, mu):
+    out = np.empty(2)
+    out[0] = state[1]
+    out[1] = mu * (1.0 - state[0] * state[0]) * state[1] - state[0]
+    return out
+
+
 def van_der_pol(t, state, mu: float = 1.0):
     """Van der Pol ODE: dx/dt = y,  dy/dt = mu*(1-x^2)*y - x"""
-    x, y = state
-    return [y, mu * (1 - x**2) * y - x]
+    return _van_der_pol_rhs(t, np.asarray(state, dtype=np.float64), float(mu))
+
+
+@njit(cache=True)
+def van_der_pol_jac(t, state, mu):
+    """Jacobian of the Van der Pol vector field: [[0, 1], [-2μxy - 1, μ(1-x²)]]"""
+    x, y = state[0], state[1]
+    jac = np.empty((2, 2))
+    jac[0, 0] = 0.0
+    jac[0, 1] = 1.0
+    jac[1, 0] = -2.0 * mu * x * y - 1.0
+    jac[1, 1] = mu * (1.0 - x * x)
+    return jac
+
+
+# Compile the jitted right-hand sides at import so the first scene does not
+# pay the JIT cost inside its first solve_ivp call.
+_van_der_pol_rhs(0.0, np.zeros(2), 1.0)
+van_der_pol_jac(0.0, np.zeros(2), 1.0)
+
+
+@functools.lru_cache(maxsize=32)
+@disk_cache("vdp")
+def _integrate_van_der_pol(mu, x0, y0, t_span, n_points):
+    t_eval = np.linspace(*t_span, n_points)
+    sol = solve_ivp(van_der_pol, t_span, [x0, y0],
+                    args=(mu,), method='LSODA', jac=van_der_pol_jac,
+                    t_eval=t_eval, rtol=1e-6, atol=1e-9)
+    return sol.y[0], sol.y[1]
 
 
 def integrate_van_der_pol(mu: float = 1.0, x0: float = 0.5, y0: float = 0.0,
                           t_span=(0, 30), n_points: int = 2000):
-    """Integrate Van der Pol and return (x, y) arrays."""
-    sol = solve_ivp(van_der_pol, t_span, [x0, y0],
-                    args=(mu,), dense_output=True,
-                    max_step=0.01)
+    """Integrate Van der Pol and return (x, y) arrays (memoized, read-only)."""
+    return _integrate_van_der_pol(float(mu), float(x0), float(y0),
+                                  tuple(t_span), int(n_points))
+
+
+@njit(cache=True)
+def _van_der_pol_batch_rhs(t, state, mu):
+    # state = [x_0, y_0, x_1, y_1, ...], one (x, y) pair per trajectory
+    out = np.empty_like(state)
+    for k in range(state.size // 2):
+        x = state[2 * k]
+        y = state[2 * k + 1]
+        out[2 * k] = y
+        out[2 * k + 1] = mu * (1.0 - x * x) * y - x
+    return out
+
+
+_van_der_pol_batch_rhs(0.0, np.zeros(2), 1.0)
+
+
+def integrate_van_der_pol_batch(mu: float, starts, t_span=(0, 30), n_points: int = 2000):
+    """
+    Integrate several Van der Pol initial conditions as one stacked ODE.
+    `starts` is a sequence of (x0, y0); returns a (K, 2, n_points) array.
+    """
+    y0 = np.asarray(starts, dtype=np.float64).ravel()
     t_eval = np.linspace(*t_span, n_points)
-    xy = sol.sol(t_eval)
-    return xy[0], xy[1]
+    sol = solve_ivp(_van_der_pol_batch_rhs, t_span, y0,
+                    args=(float(mu),), method='LSODA', t_eval=t_eval,
+                    rtol=1e-6, atol=1e-9)
+    return sol.y.reshape(-1, 2, n_points)
 
 
-def compute_vdp_poincare_map(mu: float = 2.0, x0: float = 0.1, y0: float = 0.0,
-                              t_span=(0, 200), n_points: int = 20000):
+def _vdp_poincare_from_arrays(xs, ys):
     """
-    Compute Poincaré section crossings for Van der Pol oscillator.
-    Section: y = 0, x > 0, crossing from below (dy/dt > 0 → x > 0 for VdP)
-    Returns list of (x_n, x_{n+1}) pairs for the return map.
+    Poincaré section crossings for the Van der Pol oscillator, scanned from a
+    trajectory that has already been integrated and sampled (no extra solve).
+    Section: y = 0, x > 0, crossing from above (dy/dt = -x < 0 there).
+    Returns the crossing x-values and an (N, 2) array of (x_n, x_{n+1})
+    pairs for the return map.
     """
-    xs, ys = integrate_van_der_pol(mu=mu, x0=x0, y0=y0, t_span=t_span, n_points=n_points)
-    
-    # Find crossings where y goes from negative to positive (or zero)
-    crossings = []
-    for i in range(1, len(ys)):
-        if ys[i-1] < 0 and ys[i] >= 0 and xs[i] > 0:  # Crossing y=0 upward, x>0
-            # Linear interpolation
-            if abs(ys[i] - ys[i-1]) > 1e-10:
-                t_frac = -ys[i-1] / (ys[i] - ys[i-1])
-                x_cross = xs[i-1] + t_frac * (xs[i] - xs[i-1])
-            else:
-                x_cross = xs[i]
-            crossings.append(x_cross)
-    
+    # Find crossings where y goes from positive to negative (or zero), x > 0
+    xs_prev, xs_cur = xs[:-1], xs[1:]
+    ys_prev, ys_cur = ys[:-1], ys[1:]
+    mask = (ys_prev > 0) & (ys_cur <= 0) & (xs_cur > 0)
+
+    # Linear interpolation (fall back to the later sample on a flat step)
+    dy = ys_cur[mask] - ys_prev[mask]
+    safe = np.abs(dy) > 1e-10
+    t_frac = np.where(safe, -ys_prev[mask] / np.where(safe, dy, 1.0), 1.0)
+    crossings = xs_prev[mask] + t_frac * (xs_cur[mask] - xs_prev[mask])
+
     # Create return map pairs (x_n, x_{n+1})
-    return_map = [(crossings[i], crossings[i+1]) for i in range(len(crossings)-1)]
+    return_map = np.stack([crossings[:-1], crossings[1:]], axis=1)
     return crossings, return_map
 
 
@@ -66,40 +244,140 @@ def compute_vdp_poincare_map(mu: float = 2.0, x0: float = 0.1, y0: float = 0.0,
 # Lorenz helpers
 # ---------------------------------------------------------------------------
 
+@njit(cache=True)
+def _lorenz_rhs(t, state, sigma, rho, beta):
+    x, y, z = state[0], state[1], state[2]
+    out = np.empty(3)
+    out[0] = sigma * (y - x)
+    out[1] = x * (rho - z) - y
+    out[2] = x * y - beta * z
+    return out
+
+
 def lorenz(t, state, sigma=10.0, rho=28.0, beta=8/3):
-    x, y, z = state
-    return [sigma * (y - x),
-            x * (rho - z) - y,
-            x * y - beta * z]
+    return _lorenz_rhs(t, np.asarray(state, dtype=np.float64),
+                       float(sigma), float(rho), float(beta))
+
+
+@njit(cache=True)
+def lorenz_jac(t, state, sigma, rho, beta):
+    """Jacobian of the Lorenz vector field."""
+    x, y, z = state[0], state[1], state[2]
+    jac = np.empty((3, 3))
+    jac[0, 0] = -sigma
+    jac[0, 1] = sigma
+    jac[0, 2] = 0.0
+    jac[1, 0] = rho - z
+    jac[1, 1] = -1.0
+    jac[1, 2] = -x
+    jac[2, 0] = y
+    jac[2, 1] = x
+    jac[2, 2] = -beta
+    return jac
+
+
+@njit(cache=True, fastmath=True)
+def lorenz_velocity(states, sigma, rho, beta):
+    """Lorenz vector field at each column of a (3, N) state array."""
+    out = np.empty_like(states)
+    for i in range(states.shape[1]):
+        out[:, i] = _lorenz_rhs(0.0, states[:, i], sigma, rho, beta)
+    return out
+
+
+_lorenz_rhs(0.0, np.zeros(3), 10.0, 28.0, 8 / 3)
+lorenz_jac(0.0, np.zeros(3), 10.0, 28.0, 8 / 3)
+lorenz_velocity(np.zeros((3, 1)), 10.0, 28.0, 8 / 3)
+
+
+@functools.lru_cache(maxsize=32)
+@disk_cache("lorenz")
+def _integrate_lorenz(sigma, rho, beta, x0, y0, z0, t_span, n_points):
+    t_eval = np.linspace(*t_span, n_points)
+    sol = solve_ivp(lorenz, t_span, [x0, y0, z0],
+                    args=(sigma, rho, beta), method='LSODA', jac=lorenz_jac,
+                    t_eval=t_eval, rtol=1e-6, atol=1e-9)
+    return sol.y[0], sol.y[1], sol.y[2]
 
 
 def integrate_lorenz(sigma=10.0, rho=28.0, beta=8/3,
                      x0=1.0, y0=1.0, z0=1.0,
                      t_span=(0, 50), n_points: int = 10000):
-    sol = solve_ivp(lorenz, t_span, [x0, y0, z0],
-                    args=(sigma, rho, beta), dense_output=True,
-                    max_step=0.01)
-    t_eval = np.linspace(*t_span, n_points)
-    xyz = sol.sol(t_eval)
-    return xyz[0], xyz[1], xyz[2]
+    return _integrate_lorenz(float(sigma), float(rho), float(beta),
+                             float(x0), float(y0), float(z0),
+                             tuple(t_span), int(n_points))
+
+
+@njit(cache=True, fastmath=True)
+def _rk4_lorenz_batch(sigma, rhos, beta, state0, t0, dt, n_points, substeps):
+    """Fixed-step RK4 for each ρ in `rhos`, storing every `substeps` steps."""
+    out = np.empty((rhos.shape[0], 3, n_points))
+    h = dt / substeps
+    for r in range(rhos.shape[0]):
+        rho = rhos[r]
+        state = state0.copy()
+        out[r, :, 0] = state
+        t = t0
+        for i in range(1, n_points):
+            for _ in range(substeps):
+                k1 = _lorenz_rhs(t, state, sigma, rho, beta)
+                k2 = _lorenz_rhs(t + 0.5 * h, state + 0.5 * h * k1, sigma, rho, beta)
+                k3 = _lorenz_rhs(t + 0.5 * h, state + 0.5 * h * k2, sigma, rho, beta)
+                k4 = _lorenz_rhs(t + h, state + h * k3, sigma, rho, beta)
+                state = state + (h / 6.0) * (k1 + 2.0 * k2 + 2.0 * k3 + k4)
+                t += h
+            out[r, :, i] = state
+    return out
+
+
+_rk4_lorenz_batch(10.0, np.array([28.0]), 8 / 3, np.ones(3), 0.0, 0.005, 2, 1)
+
+
+def integrate_lorenz_batch(rhos, sigma=10.0, beta=8/3, x0=1.0, y0=1.0, z0=1.0,
+                           t_span=(0, 50), n_points: int = 10000):
+    """
+    Integrate the Lorenz system for several ρ from the same initial state in
+    one jitted call (fixed-step RK4, step <= 0.005).
+    Returns a (len(rhos), 3, n_points) array on linspace(*t_span, n_points).
+    """
+    dt = (t_span[1] - t_span[0]) / max(n_points - 1, 1)
+    substeps = max(int(np.ceil(abs(dt) / 0.005)), 1)
+    return _rk4_lorenz_batch(float(sigma), np.asarray(rhos, dtype=np.float64), float(beta),
+                             np.array([x0, y0, z0], dtype=np.float64),
+                             float(t_span[0]), dt, int(n_points), substeps)
 
 
 # ---------------------------------------------------------------------------
 # Scene: Van der Pol oscillator in 2D (embedded in 3D for nicer camera)
 # ---------------------------------------------------------------------------
 
-def compute_limit_cycle_boundary(mu: float = 2.0, n_points: int = 500):
+@disk_cache("limit_cycle_family")
+def compute_limit_cycle_family(mu_min: float = 0.05, mu_max: float = 5.0,
+                               n_mu: int = 60, n_vertices: int = 500):
     """
-    Compute the stable limit cycle boundary by integrating for a long time
-    and extracting the final periodic orbit.
+    One period of the limit cycle for each μ on a uniform grid, resampled to
+    n_vertices points starting at the maximum of x, so that cycles for
+    neighbouring μ can be blended vertex by vertex.
+    Returns (mu_grid, cycles) with cycles of shape (n_mu, n_vertices, 2).
     """
-    # Integrate long enough to reach limit cycle
-    sol = solve_ivp(van_der_pol, (0, 100), [0.1, 0.0],
-                    args=(mu,), dense_output=True, max_step=0.01)
-    # Extract last period (roughly)
-    t_final = np.linspace(90, 100, n_points)
-    xy = sol.sol(t_final)
-    return xy[0], xy[1]
+    mu_grid = np.linspace(mu_min, mu_max, n_mu)
+    t_eval = np.linspace(70, 100, 3001)
+    phase = np.linspace(0, 1, n_vertices)
+    cycles = np.empty((n_mu, n_vertices, 2))
+    for k, mu in enumerate(mu_grid):
+        # Start on the amplitude-2 circle so even small μ has converged by t=70
+        sol = solve_ivp(van_der_pol, (0, 100), [2.0, 0.0],
+                        args=(float(mu),), method='LSODA', jac=van_der_pol_jac,
+                        t_eval=t_eval, rtol=1e-6, atol=1e-9)
+        xs, ys = sol.y
+        # Maxima of x are the downward zero crossings of y; take the last two
+        peaks = np.flatnonzero((ys[:-1] > 0) & (ys[1:] <= 0))[-2:]
+        peaks = peaks + ys[peaks] / (ys[peaks] - ys[peaks + 1])
+        idx = peaks[0] + phase * (peaks[1] - peaks[0])
+        samples = np.arange(len(xs))
+        cycles[k, :, 0] = np.interp(idx, samples, xs)
+        cycles[k, :, 1] = np.interp(idx, samples, ys)
+    return mu_grid, cycles
 
 
 class VanDerPolScene(ThreeDScene):
@@ -123,12 +401,16 @@ class VanDerPolScene(ThreeDScene):
 
         mu = 2.0
 
+        # One long trajectory (dt = 0.01) serves the limit cycle, the drawn
+        # curve and the Poincaré crossings
+        xs_full, ys_full = integrate_van_der_pol(mu=mu, x0=0.1, y0=0.0, t_span=(0, 100), n_points=10000)
+
         # --- LIMIT CYCLE BOUNDARY ---
-        lc_x, lc_y = compute_limit_cycle_boundary(mu=mu)
-        lc_points = [axes.c2p(x, y, 0) for x, y in zip(lc_x, lc_y)]
+        # The last 10 time units (> one period) lie on the limit cycle
+        lc_x, lc_y = xs_full[-1000:], ys_full[-1000:]
+        lc_points = c2p_batch(axes, np.column_stack([lc_x, lc_y, np.zeros_like(lc_x)]))
         
-        limit_cycle = VMobject()
-        limit_cycle.set_points_smoothly(lc_points + [lc_points[0]])
+        limit_cycle = make_curve(np.vstack([lc_points, lc_points[:1]]), smooth=True)
         limit_cycle.set_stroke(color=GOLD, width=4, opacity=0.9)
         limit_cycle_glow = limit_cycle.copy().set_stroke(color=YELLOW, width=8, opacity=0.3)
         
@@ -151,18 +433,17 @@ class VanDerPolScene(ThreeDScene):
         self.play(Create(poincare_line), Write(poincare_label), run_time=1)
 
         # --- TRAJECTORY WITH POINCARÉ CROSSINGS ---
-        x_traj, y_traj = integrate_van_der_pol(mu=mu, x0=0.1, y0=0.0, t_span=(0, 40), n_points=4000)
-        points_traj = [axes.c2p(x, y, 0) for x, y in zip(x_traj, y_traj)]
+        x_traj, y_traj = xs_full[:4000], ys_full[:4000]  # t in [0, 40)
+        points_traj = c2p_batch(axes, np.column_stack([x_traj, y_traj, np.zeros_like(x_traj)]))
         
-        curve = VMobject().set_points_smoothly(points_traj)
+        curve = make_curve(points_traj, smooth=True)
         curve.set_stroke(color=BLUE, width=2)
         
         # Find and mark Poincaré crossings
-        crossings, _ = compute_vdp_poincare_map(mu=mu, x0=0.1, y0=0.0, t_span=(0, 40))
-        crossing_dots = VGroup()
-        for x_cross in crossings[:15]:  # First 15 crossings
-            dot = Dot3D(point=axes.c2p(x_cross, 0, 0), color=YELLOW, radius=0.08)
-            crossing_dots.add(dot)
+        crossings, _ = _vdp_poincare_from_arrays(xs_full, ys_full)
+        first = crossings[:15]  # First 15 crossings
+        crossing_pts = c2p_batch(axes, np.column_stack([first, np.zeros((len(first), 2))]))
+        crossing_dots = VGroup(*[Dot3D(point=p, color=YELLOW, radius=0.08) for p in crossing_pts])
         
         self.play(Create(curve), run_time=6, rate_func=linear)
         self.play(FadeIn(crossing_dots, lag_ratio=0.1), run_time=1.5)
@@ -213,26 +494,25 @@ class VanDerPolScene(ThreeDScene):
         self.play(Create(diagonal), Write(diag_label), run_time=0.5)
         
         # Plot return map points - use multiple initial conditions for variety
-        map_dots = VGroup()
-        all_crossings = []
-        all_return_map = []
-        
-        # Gather crossings from multiple starting points
-        for x0_start in [0.1, 0.5, 1.0, 2.0, 3.0]:
-            crossings_temp, return_map_temp = compute_vdp_poincare_map(
-                mu=mu, x0=x0_start, y0=0.0, t_span=(0, 100), n_points=10000
-            )
-            all_crossings.extend(crossings_temp)
-            all_return_map.extend(return_map_temp)
-        
-        # Create dots from return map
-        for x_n, x_np1 in all_return_map[:80]:
-            if 0 < x_n < 2.5 and 0 < x_np1 < 2.5:  # Keep in bounds
-                dot = Dot(point=map_axes.c2p(x_n, x_np1), color=BLUE, radius=0.04)
-                map_dots.add(dot)
+        # Gather crossings from multiple starting points (integrated together)
+        starts = [(x0_start, 0.0) for x0_start in [0.1, 0.5, 1.0, 2.0, 3.0]]
+        batch = integrate_van_der_pol_batch(mu, starts, t_span=(0, 100), n_points=10000)
+        sections = [_vdp_poincare_from_arrays(xs_start, ys_start) for xs_start, ys_start in batch]
+        all_crossings = np.concatenate([crossings_k for crossings_k, _ in sections])
+        all_return_map = np.concatenate([return_map_k for _, return_map_k in sections])
+        
+        # Create dots from return map (bounds filter and c2p done array-wide),
+        # in a few single-mobject batches rather than one Dot per point
+        shown = all_return_map[:80]
+        in_bounds = (shown[:, 0] > 0) & (shown[:, 0] < 2.5) & (shown[:, 1] > 0) & (shown[:, 1] < 2.5)
+        map_dots = VGroup(*[
+            make_dot_cloud(batch, radius=0.04, color=BLUE)
+            for batch in np.array_split(c2p_batch(map_axes, shown[in_bounds]), 10)
+            if len(batch) > 0
+        ])
         
         # Fixed point on diagonal (limit cycle crossing)
-        fp_x = all_crossings[-1] if all_crossings else 2.0
+        fp_x = all_crossings[-1] if len(all_crossings) > 0 else 2.0
         fp_dot = Dot(point=map_axes.c2p(fp_x, fp_x), color=GREEN, radius=0.08)
         fp_label = Text(f"Fixed Point: x* ≈ {fp_x:.2f}", font_size=16, color=GREEN)
         fp_label.to_corner(UR)
@@ -244,26 +524,26 @@ class VanDerPolScene(ThreeDScene):
         
         # Handle case where map_dots might be empty
         if len(map_dots) > 0:
-            self.play(LaggedStartMap(FadeIn, map_dots, lag_ratio=0.05), run_time=3)
+            self.play(LaggedStartMap(FadeIn, map_dots, lag_ratio=0.2), run_time=3)
         
         self.play(FadeIn(fp_dot, scale=2), Write(fp_label), run_time=1)
         
         # Show cobweb diagram
-        cobweb = VGroup()
-        if len(all_return_map) > 0:
-            for i in range(min(20, len(all_return_map))):
-                x_n, x_np1 = all_return_map[i]
-                if 0 < x_n < 2.5 and 0 < x_np1 < 2.5:
-                    # Vertical line to curve
-                    v_line = Line(map_axes.c2p(x_n, x_n), map_axes.c2p(x_n, x_np1), color=RED, stroke_width=1)
-                    # Horizontal line to diagonal
-                    h_line = Line(map_axes.c2p(x_n, x_np1), map_axes.c2p(x_np1, x_np1), color=RED, stroke_width=1)
-                    cobweb.add(v_line, h_line)
+        steps = all_return_map[:20]
+        steps = steps[(steps[:, 0] > 0) & (steps[:, 0] < 2.5) & (steps[:, 1] > 0) & (steps[:, 1] < 2.5)]
+        on_curve = c2p_batch(map_axes, steps)               # (x_n, x_{n+1})
+        diag_n = c2p_batch(map_axes, steps[:, [0, 0]])      # (x_n, x_n)
+        diag_np1 = c2p_batch(map_axes, steps[:, [1, 1]])    # (x_{n+1}, x_{n+1})
+        # Vertical line to curve, then horizontal line to diagonal, per step
+        cobweb = make_segments(
+            np.stack([diag_n, on_curve], axis=1).reshape(-1, 3),
+            np.stack([on_curve, diag_np1], axis=1).reshape(-1, 3),
+        ).set_stroke(color=RED, width=1)
         
         cobweb_label = Text("Cobweb: convergence to limit cycle", font_size=16, color=RED)
         cobweb_label.to_edge(DOWN)
         
-        if len(cobweb) > 0:
+        if len(steps) > 0:
             self.play(Create(cobweb), Write(cobweb_label), run_time=3)
         else:
             self.play(Write(cobweb_label), run_time=1)
@@ -295,11 +575,13 @@ class LimitCycleConvergenceScene(ThreeDScene):
         colors = [RED, GREEN, ORANGE, PURPLE, TEAL]
         starts = [(0.1, 0), (3, 0), (-2, 4), (1, -3), (-3, -2)]
 
+        # All starts are integrated together as one stacked system
+        batch = integrate_van_der_pol_batch(mu, starts, t_span=(0, 30), n_points=1500)
+
         curves = VGroup()
-        for (x0, y0), col in zip(starts, colors):
-            xs, ys = integrate_van_der_pol(mu=mu, x0=x0, y0=y0, t_span=(0, 30), n_points=1500)
-            pts = [axes.c2p(x, y, 0) for x, y in zip(xs, ys)]
-            curve = VMobject().set_points_smoothly(pts).set_stroke(col, width=2)
+        for (xs, ys), col in zip(batch, colors):
+            pts = c2p_batch(axes, np.column_stack([xs, ys, np.zeros_like(xs)]))
+            curve = make_curve(pts, smooth=True).set_stroke(col, width=2)
             curves.add(curve)
 
         self.play(LaggedStartMap(Create, curves, lag_ratio=0.3), run_time=8)
@@ -313,17 +595,16 @@ class LimitCycleConvergenceScene(ThreeDScene):
 def compute_poincare_crossings(xs, ys, zs, z_section=27.0):
     """
     Find points where trajectory crosses the Poincaré section plane z = z_section
-    from below (dz > 0).
-    """
-    crossings = []
-    for i in range(1, len(zs)):
-        if zs[i-1] < z_section <= zs[i]:  # Crossing from below
-            # Linear interpolation for more accurate crossing point
-            t_frac = (z_section - zs[i-1]) / (zs[i] - zs[i-1])
-            x_cross = xs[i-1] + t_frac * (xs[i] - xs[i-1])
-            y_cross = ys[i-1] + t_frac * (ys[i] - ys[i-1])
-            crossings.append((x_cross, y_cross, z_section))
-    return crossings
+    from below (dz > 0). Returns an (N, 3) array of crossing points.
+    """
+    mask = (zs[:-1] < z_section) & (z_section <= zs[1:])  # Crossing from below
+    z_prev, z_cur = zs[:-1][mask], zs[1:][mask]
+
+    # Linear interpolation for more accurate crossing point
+    t_frac = (z_section - z_prev) / (z_cur - z_prev)
+    x_cross = xs[:-1][mask] + t_frac * (xs[1:][mask] - xs[:-1][mask])
+    y_cross = ys[:-1][mask] + t_frac * (ys[1:][mask] - ys[:-1][mask])
+    return np.column_stack([x_cross, y_cross, np.full_like(x_cross, z_section)])
 
 
 class LorenzAttractorScene(ThreeDScene):
@@ -385,16 +666,16 @@ class LorenzAttractorScene(ThreeDScene):
         eq_labels = VGroup(origin_label, c_plus_label, c_minus_label)
         
         # --- POINCARÉ SECTION PLANE ---
-        # Create semi-transparent plane at z = 27
-        poincare_plane = Surface(
-            lambda u, v: axes.c2p(u, v, z_section),
-            u_range=[-25, 25],
-            v_range=[-25, 25],
-            resolution=(20, 20),
+        # Create semi-transparent plane at z = 27 (flat, so one polygon suffices)
+        corners = c2p_batch(axes, [(-25, -25, z_section), (25, -25, z_section),
+                                   (25, 25, z_section), (-25, 25, z_section)])
+        poincare_plane = Polygon(
+            *corners,
+            fill_color=TEAL_E,
             fill_opacity=0.15,
+            stroke_color=TEAL_E,
             stroke_width=0.5,
             stroke_opacity=0.3,
-            checkerboard_colors=[TEAL_E, TEAL_D],
         )
         
         plane_label = Text(f"Poincaré Section (z = {z_section:.0f})", font_size=18, color=TEAL)
@@ -404,23 +685,20 @@ class LorenzAttractorScene(ThreeDScene):
         xs, ys, zs = integrate_lorenz(sigma=sigma, rho=rho, beta=beta,
                                        t_span=(0, 50), n_points=12000)
 
-        def scale_pt(x, y, z):
-            return axes.c2p(x, y, z)
+        points = c2p_batch(axes, np.column_stack([xs, ys, zs]))
 
-        points = [scale_pt(x, y, z) for x, y, z in zip(xs, ys, zs)]
-
-        # Gradient color along the path
-        curve = VMobject()
-        curve.set_points_smoothly(points)
+        # Gradient color along the path (dense enough that corners read as smooth)
+        curve = make_curve(points, max_pts=4000)
         curve.set_stroke(width=1.5)
         curve.set_color_by_gradient(BLUE, PURPLE, RED, ORANGE)
 
         # --- POINCARÉ CROSSINGS ---
         crossings = compute_poincare_crossings(xs, ys, zs, z_section=z_section)
-        crossing_dots = VGroup()
-        for x, y, z in crossings[:100]:  # Limit to first 100 crossings
-            dot = Dot3D(point=axes.c2p(x, y, z), color=YELLOW, radius=0.06)
-            crossing_dots.add(dot)
+        # Limit to first 100 crossings; coarse spheres are plenty at this radius
+        crossing_dots = VGroup(*[
+            Dot3D(point=p, color=YELLOW, radius=0.06, resolution=(6, 6))
+            for p in c2p_batch(axes, crossings[:100])
+        ])
 
         # --- ANIMATION SEQUENCE ---
         
@@ -505,6 +783,16 @@ class IntroScene(Scene):
 # Scene: Hopf Bifurcation - transition from stable focus to limit cycle
 # ---------------------------------------------------------------------------
 
+@njit(cache=True)
+def _hopf_rhs(t, state, mu):
+    x, y = state[0], state[1]
+    r_sq = x * x + y * y
+    out = np.empty(2)
+    out[0] = mu * x - y - x * r_sq
+    out[1] = x + mu * y - y * r_sq
+    return out
+
+
 def hopf_system(t, state, mu: float):
     """
     Normal form of supercritical Hopf bifurcation:
@@ -517,20 +805,25 @@ def hopf_system(t, state, mu: float):
     For μ < 0: stable focus at origin
     For μ > 0: unstable origin, stable limit cycle at r = √μ
     """
-    x, y = state
-    r_sq = x**2 + y**2
-    dxdt = mu * x - y - x * r_sq
-    dydt = x + mu * y - y * r_sq
-    return [dxdt, dydt]
+    return _hopf_rhs(t, np.asarray(state, dtype=np.float64), float(mu))
 
 
-def integrate_hopf(mu: float, x0: float, y0: float, t_span=(0, 30), n_points: int = 2000):
-    """Integrate Hopf normal form system."""
-    sol = solve_ivp(hopf_system, t_span, [x0, y0],
-                    args=(mu,), dense_output=True, max_step=0.01)
+_hopf_rhs(0.0, np.zeros(2), 0.0)
+
+
+@functools.lru_cache(maxsize=32)
+@disk_cache("hopf")
+def _integrate_hopf(mu, x0, y0, t_span, n_points):
     t_eval = np.linspace(*t_span, n_points)
-    xy = sol.sol(t_eval)
-    return xy[0], xy[1]
+    sol = solve_ivp(hopf_system, t_span, [x0, y0],
+                    args=(mu,), method='LSODA', t_eval=t_eval, rtol=1e-6, atol=1e-9)
+    return sol.y[0], sol.y[1]
+
+
+def integrate_hopf(mu: float, x0: float, y0: float, t_span=(0, 30), n_points: int = 2000):
+    """Integrate Hopf normal form system (memoized, read-only)."""
+    return _integrate_hopf(float(mu), float(x0), float(y0),
+                           tuple(t_span), int(n_points))
 
 
 class HopfBifurcationScene(Scene):
@@ -621,7 +914,7 @@ class HopfBifurcationScene(Scene):
         trajectories_neg = VGroup()
         for (x0, y0), col in zip(starts, colors):
             xs, ys = integrate_hopf(mu_val, x0, y0, t_span=(0, 15))
-            pts = [axes.c2p(x, y) + LEFT * 3 for x, y in zip(xs, ys)]
+            pts = c2p_batch(axes, np.column_stack([xs, ys])) + LEFT * 3
             curve = VMobject().set_points_smoothly(pts).set_stroke(col, width=2)
             trajectories_neg.add(curve)
         
@@ -660,8 +953,8 @@ class HopfBifurcationScene(Scene):
         r_lc = np.sqrt(mu_val)
         theta = np.linspace(0, 2 * np.pi, 100)
         lc_xs, lc_ys = r_lc * np.cos(theta), r_lc * np.sin(theta)
-        lc_pts = [axes.c2p(x, y) + LEFT * 3 for x, y in zip(lc_xs, lc_ys)]
-        limit_cycle = VMobject().set_points_smoothly(lc_pts + [lc_pts[0]])
+        lc_pts = c2p_batch(axes, np.column_stack([lc_xs, lc_ys])) + LEFT * 3
+        limit_cycle = VMobject().set_points_smoothly(np.vstack([lc_pts, lc_pts[:1]]))
         limit_cycle.set_stroke(color=GOLD, width=4)
         
         self.play(Create(limit_cycle), run_time=2)
@@ -672,7 +965,7 @@ class HopfBifurcationScene(Scene):
         
         for (x0, y0), col in zip(starts_pos, colors):
             xs, ys = integrate_hopf(mu_val, x0, y0, t_span=(0, 20))
-            pts = [axes.c2p(x, y) + LEFT * 3 for x, y in zip(xs, ys)]
+            pts = c2p_batch(axes, np.column_stack([xs, ys])) + LEFT * 3
             curve = VMobject().set_points_smoothly(pts).set_stroke(col, width=2)
             trajectories_pos.add(curve)
         
@@ -745,22 +1038,56 @@ def henon_jacobian_eigenvalues(x, a=1.4, b=0.3):
     return lambda1, lambda2
 
 
-def iterate_henon(a=1.4, b=0.3, x0=0.0, y0=0.0, n_iter=10000, n_transient=1000):
-    """Iterate Hénon map, discarding transient."""
+def classify_henon_points(xs, a=1.4, b=0.3):
+    """
+    Stability label ("spiral", "saddle" or "stable") of the Hénon map at
+    each x in `xs`, from the closed-form Jacobian eigenvalues in real
+    arithmetic: complex eigenvalues when trace² + 4b < 0, otherwise the
+    spectral radius is (|trace| + √disc) / 2.
+    """
+    trace = -2 * a * np.asarray(xs, dtype=np.float64)
+    disc = trace**2 + 4 * b
+    radius = (np.abs(trace) + np.sqrt(np.maximum(disc, 0.0))) / 2
+    return np.select([disc < 0, radius > 1], ["spiral", "saddle"], "stable")
+
+
+@njit(cache=True, fastmath=True)
+def _iterate_henon(a, b, x0, y0, n_iter, n_transient):
+    xs = np.empty(n_iter + 1)
+    ys = np.empty(n_iter + 1)
     x, y = x0, y0
-    
+
     # Transient
     for _ in range(n_transient):
-        x, y = henon_map(x, y, a, b)
-    
+        x, y = 1.0 - a * x * x + y, b * x
+
     # Collect points on attractor
-    xs, ys = [x], [y]
-    for _ in range(n_iter):
-        x, y = henon_map(x, y, a, b)
-        xs.append(x)
-        ys.append(y)
-    
-    return np.array(xs), np.array(ys)
+    xs[0] = x
+    ys[0] = y
+    for i in range(n_iter):
+        x, y = 1.0 - a * x * x + y, b * x
+        xs[i + 1] = x
+        ys[i + 1] = y
+
+    return xs, ys
+
+
+@functools.lru_cache(maxsize=8)
+def _henon_trajectory(a, b, x0, y0, n_iter, n_transient):
+    xs, ys = _iterate_henon(a, b, x0, y0, n_iter, n_transient)
+    xs.setflags(write=False)
+    ys.setflags(write=False)
+    return xs, ys
+
+
+def iterate_henon(a=1.4, b=0.3, x0=0.0, y0=0.0, n_iter=10000, n_transient=1000):
+    """
+    Iterate Hénon map, discarding transient (memoized, read-only).
+    Take subsets of a long orbit by slicing the result rather than iterating
+    again with a smaller n_iter.
+    """
+    return _henon_trajectory(float(a), float(b), float(x0), float(y0),
+                             int(n_iter), int(n_transient))
 
 
 class HenonAttractorScene(Scene):
@@ -810,26 +1137,20 @@ class HenonAttractorScene(Scene):
         fp_dots = VGroup()
         fp_labels = VGroup()
         
-        fp_title = Text("Fixed Points (Unstable)", font_size=18, color=RED)
+        # Classify stability from the Jacobian eigenvalues, for all fixed points
+        # at once; the title calls them unstable only when every one is a saddle
+        stab_strs = classify_henon_points([fx for fx, _ in fixed_pts], a, b)
+        
+        fp_title = Text("Fixed Points (Unstable)" if np.all(stab_strs == "saddle") else "Fixed Points",
+                        font_size=18, color=RED)
         fp_title.next_to(map_eq, DOWN, aligned_edge=LEFT, buff=0.3)
-        self.play(Write(fp_title))
+        self.play(FadeIn(fp_title, shift=UP * 0.2))
         
         for i, (fx, fy) in enumerate(fixed_pts):
-            # Check stability via eigenvalues
-            eig1, eig2 = henon_jacobian_eigenvalues(fx, a, b)
-            
             # Create fixed point marker
             fp_dot = Dot(axes.c2p(fx, fy), color=RED, radius=0.12)
             fp_dot.set_stroke(color=WHITE, width=2)
             
-            # Stability info
-            if isinstance(eig1, complex):
-                stab_str = f"spiral"
-            elif abs(eig1) > 1 or abs(eig2) > 1:
-                stab_str = f"saddle"
-            else:
-                stab_str = f"stable"
-            
             label_text = f"P{i+1}: ({fx:.2f}, {fy:.2f})"
             fp_label = Text(label_text, font_size=14, color=RED)
             fp_label.next_to(fp_dot, UP + RIGHT, buff=0.1)
@@ -842,7 +1163,7 @@ class HenonAttractorScene(Scene):
             run_time=1.5
         )
         self.play(
-            *[Write(lbl) for lbl in fp_labels],
+            FadeIn(fp_labels, shift=UP * 0.2),
             run_time=1
         )
         self.wait(1)
@@ -850,26 +1171,28 @@ class HenonAttractorScene(Scene):
         # --- PHASE 1: Show first few iterations ---
         phase1_label = Text("First Iterations", font_size=20, color=BLUE)
         phase1_label.to_corner(UR)
-        self.play(Write(phase1_label))
+        self.play(FadeIn(phase1_label, shift=UP * 0.2))
         
-        x, y = 0.0, 0.0
-        initial_dot = Dot(axes.c2p(x, y), color=RED, radius=0.1)
+        # Orbit of the origin: starting point plus 15 iterates
+        orbit_xs, orbit_ys = iterate_henon(a=a, b=b, x0=0.0, y0=0.0, n_iter=15, n_transient=0)
+        orbit = c2p_batch(axes, np.column_stack([orbit_xs, orbit_ys]))
+        initial_dot = Dot(orbit[0], color=RED, radius=0.1)
         self.play(FadeIn(initial_dot, scale=2))
         
-        iteration_dots = VGroup()
-        arrows = VGroup()
+        iteration_dots = VGroup(*[Dot(end, color=BLUE, radius=0.06) for end in orbit[1:]])
+        arrows = VGroup(*[
+            Arrow(start, end, buff=0.1, stroke_width=1, color=GRAY)
+            for start, end in zip(orbit[:-1], orbit[1:])
+        ])
         
-        for i in range(15):
-            x_new, y_new = henon_map(x, y, a, b)
-            new_dot = Dot(axes.c2p(x_new, y_new), color=BLUE, radius=0.06)
-            arrow = Arrow(axes.c2p(x, y), axes.c2p(x_new, y_new), 
-                         buff=0.1, stroke_width=1, color=GRAY)
-            
-            iteration_dots.add(new_dot)
-            arrows.add(arrow)
-            
-            self.play(Create(arrow), FadeIn(new_dot), run_time=0.3)
-            x, y = x_new, y_new
+        # One animation for all steps: each arrow and its dot in turn, 0.3s apart
+        self.play(
+            LaggedStart(*[
+                AnimationGroup(Create(arrow), FadeIn(dot))
+                for arrow, dot in zip(arrows, iteration_dots)
+            ], lag_ratio=1.0),
+            run_time=0.3 * len(arrows)
+        )
         
         self.wait(1)
         
@@ -888,24 +1211,25 @@ class HenonAttractorScene(Scene):
         
         phase2_label = Text("Building the Strange Attractor...", font_size=20, color=GOLD)
         phase2_label.to_corner(UR)
-        self.play(Write(phase2_label))
+        self.play(FadeIn(phase2_label, shift=UP * 0.2))
         
         # Generate attractor points
         xs, ys = iterate_henon(a=a, b=b, n_iter=20000, n_transient=500)
         
-        # Create dots in batches for animation
-        attractor_dots = VGroup()
+        # Create dots in batches for animation: each batch is a single
+        # mobject holding all of its dots, instead of one Dot per point
         n_show = 8000  # Points to display
-        indices = np.random.choice(len(xs), size=min(n_show, len(xs)), replace=False)
-        
-        for idx in indices:
-            dot = Dot(axes.c2p(xs[idx], ys[idx]), radius=0.01, color=WHITE)
-            dot.set_fill(opacity=0.7)
-            attractor_dots.add(dot)
+        # Deterministic stride subsample; the orbit is ergodic on the attractor
+        stride = max(1, len(xs) // n_show)
+        pts = c2p_batch(axes, np.column_stack([xs[::stride][:n_show], ys[::stride][:n_show]]))
+        attractor_dots = VGroup(*[
+            make_dot_cloud(batch, radius=0.01, color=WHITE, opacity=0.7)
+            for batch in np.array_split(pts, 40)
+        ])
         
         # Animate appearance in waves
         self.play(
-            LaggedStartMap(FadeIn, attractor_dots, lag_ratio=0.001),
+            LaggedStartMap(FadeIn, attractor_dots, lag_ratio=0.2),
             run_time=6
         )
         
@@ -925,16 +1249,16 @@ class HenonAttractorScene(Scene):
             width=1.5, height=0.6,
             stroke_color=YELLOW, stroke_width=2
         )
-        zoom_box.move_to(axes.c2p(0.6, 0.18))
+        zoom_center = axes.c2p(0.6, 0.18)
+        zoom_box.move_to(zoom_center)
         
         self.play(Transform(phase2_label, zoom_label), Create(zoom_box), run_time=1)
         self.wait(0.5)
         
-        # Zoom in
+        # Zoom in (axes and everything plotted on them move as one group)
+        zoomed = VGroup(axes, attractor_dots, fp_dots)
         self.play(
-            axes.animate.scale(3).move_to(axes.c2p(0.6, 0.18) * 3),
-            attractor_dots.animate.scale(3).move_to(axes.c2p(0.6, 0.18) * 3),
-            fp_dots.animate.scale(3).move_to(axes.c2p(0.6, 0.18) * 3),
+            zoomed.animate.scale(3).move_to(zoom_center * 3),
             FadeOut(zoom_box),
             FadeOut(param_text), FadeOut(map_eq), FadeOut(axes_labels),
             FadeOut(fp_labels),
@@ -944,22 +1268,20 @@ class HenonAttractorScene(Scene):
         # Explanation
         fractal_text = Text("Each 'line' is actually many parallel strands", font_size=18, color=YELLOW)
         fractal_text.to_edge(DOWN)
-        self.play(Write(fractal_text))
+        self.play(FadeIn(fractal_text, shift=UP * 0.2))
         
         self.wait(1)
         
         # Highlight the layered structure
         highlight_text = Text("Infinite layers → Fractal Dimension ≈ 1.26", font_size=18, color=GREEN)
         highlight_text.next_to(fractal_text, UP)
-        self.play(Write(highlight_text))
+        self.play(FadeIn(highlight_text, shift=UP * 0.2))
         
         self.wait(2)
         
         # Zoom back out
         self.play(
-            axes.animate.scale(1/3).move_to(ORIGIN),
-            attractor_dots.animate.scale(1/3).move_to(ORIGIN),
-            fp_dots.animate.scale(1/3).move_to(ORIGIN),
+            zoomed.animate.scale(1/3).move_to(ORIGIN),
             FadeOut(fractal_text), FadeOut(highlight_text),
             run_time=2
         )
@@ -976,6 +1298,16 @@ class HenonAttractorScene(Scene):
 # Scene: Explicit Poincaré Section of Rössler Strange Attractor
 # ---------------------------------------------------------------------------
 
+@njit(cache=True)
+def _rossler_rhs(t, state, a, b, c):
+    x, y, z = state[0], state[1], state[2]
+    out = np.empty(3)
+    out[0] = -y - z
+    out[1] = x + a * y
+    out[2] = b + z * (x - c)
+    return out
+
+
 def rossler_system(t, state, a=0.2, b=0.2, c=5.7):
     """
     Rössler system: 
@@ -983,52 +1315,85 @@ def rossler_system(t, state, a=0.2, b=0.2, c=5.7):
     dy/dt = x + a*y
     dz/dt = b + z*(x - c)
     """
-    x, y, z = state
-    return [-y - z, x + a * y, b + z * (x - c)]
+    return _rossler_rhs(t, np.asarray(state, dtype=np.float64),
+                        float(a), float(b), float(c))
+
+
+_rossler_rhs(0.0, np.zeros(3), 0.2, 0.2, 5.7)
+
+
+@njit(cache=True)
+def _rk4_rossler(a, b, c, state0, t0, dt, n_points, substeps, n_transient):
+    """
+    Fixed-step RK4 over n_points samples dt apart (each taken in `substeps`
+    steps), storing all but the first n_transient samples.
+    """
+    out = np.empty((3, n_points - n_transient))
+    state = state0.copy()
+    h = dt / substeps
+    t = t0
+    for i in range(n_points):
+        if i > 0:
+            for _ in range(substeps):
+                k1 = _rossler_rhs(t, state, a, b, c)
+                k2 = _rossler_rhs(t + 0.5 * h, state + 0.5 * h * k1, a, b, c)
+                k3 = _rossler_rhs(t + 0.5 * h, state + 0.5 * h * k2, a, b, c)
+                k4 = _rossler_rhs(t + h, state + h * k3, a, b, c)
+                state = state + (h / 6.0) * (k1 + 2.0 * k2 + 2.0 * k3 + k4)
+                t += h
+        if i >= n_transient:
+            out[:, i - n_transient] = state
+    return out
+
+
+_rk4_rossler(0.2, 0.2, 5.7, np.ones(3), 0.0, 0.01, 2, 1, 0)
 
 
 def integrate_rossler(a=0.2, b=0.2, c=5.7, x0=1.0, y0=1.0, z0=1.0,
-                      t_span=(0, 500), n_points=50000):
-    """Integrate Rössler system."""
-    sol = solve_ivp(rossler_system, t_span, [x0, y0, z0],
-                    args=(a, b, c), dense_output=True, max_step=0.05)
-    t_eval = np.linspace(*t_span, n_points)
-    xyz = sol.sol(t_eval)
+                      t_span=(0, 500), n_points=50000, n_transient=0):
+    """
+    Integrate Rössler system (fixed-step RK4, step <= 0.01) on n_points
+    samples of t_span, dropping the first n_transient samples in the
+    integrator so only the kept part is stored.
+    """
+    t_eval = np.linspace(*t_span, n_points)[n_transient:]
+    dt = (t_span[1] - t_span[0]) / max(n_points - 1, 1)
+    substeps = max(int(np.ceil(abs(dt) / 0.01)), 1)
+    xyz = _rk4_rossler(float(a), float(b), float(c), np.array([x0, y0, z0], dtype=np.float64),
+                       float(t_span[0]), dt, int(n_points), substeps, int(n_transient))
     return xyz[0], xyz[1], xyz[2], t_eval
 
 
 def compute_rossler_poincare(xs, ys, zs, section_axis='y', section_value=0.0, direction='positive'):
     """
     Compute Poincaré section crossings for Rössler attractor.
-    Returns crossing points on the specified plane.
+    Returns an (N, 3) array of crossing points on the specified plane.
     """
-    crossings = []
-    
+    xs, ys, zs = (np.asarray(v, dtype=np.float64) for v in (xs, ys, zs))
+
     if section_axis == 'y':
         values = ys
     elif section_axis == 'x':
         values = xs
     else:
         values = zs
-    
-    for i in range(1, len(values)):
-        if direction == 'positive':
-            crossing = values[i-1] < section_value <= values[i]
-        else:
-            crossing = values[i-1] > section_value >= values[i]
-        
-        if crossing:
-            # Linear interpolation
-            if abs(values[i] - values[i-1]) > 1e-10:
-                t_frac = (section_value - values[i-1]) / (values[i] - values[i-1])
-            else:
-                t_frac = 0.5
-            
-            x_cross = xs[i-1] + t_frac * (xs[i] - xs[i-1])
-            y_cross = ys[i-1] + t_frac * (ys[i] - ys[i-1])
-            z_cross = zs[i-1] + t_frac * (zs[i] - zs[i-1])
-            crossings.append((x_cross, y_cross, z_cross))
-    
+
+    prev, nxt = values[:-1], values[1:]
+    if direction == 'positive':
+        idx = np.flatnonzero((prev < section_value) & (section_value <= nxt))
+    else:
+        idx = np.flatnonzero((prev > section_value) & (section_value >= nxt))
+
+    # Linear interpolation at the crossings only (midpoint on a flat step),
+    # fused over x, y, z and done in place on the (N, 3) endpoint block
+    denom = nxt[idx] - prev[idx]
+    safe = np.abs(denom) > 1e-10
+    t_frac = np.where(safe, (section_value - prev[idx]) / np.where(safe, denom, 1.0), 0.5)
+    p0 = np.column_stack([xs[idx], ys[idx], zs[idx]])
+    crossings = np.column_stack([xs[idx + 1], ys[idx + 1], zs[idx + 1]])
+    crossings -= p0
+    crossings *= t_frac[:, None]
+    crossings += p0
     return crossings
 
 
@@ -1061,14 +1426,12 @@ class PoincareStrangeAttractorScene(ThreeDScene):
         
         # Rössler parameters and integration
         a, b, c = 0.2, 0.2, 5.7
-        xs, ys, zs, ts = integrate_rossler(a=a, b=b, c=c, t_span=(0, 300), n_points=30000)
+        # Transient (first 5000 samples) is discarded inside the integrator
+        xs, ys, zs, ts = integrate_rossler(a=a, b=b, c=c, t_span=(0, 300), n_points=30000,
+                                           n_transient=5000)
         
-        # Discard transient
-        skip = 5000
-        xs, ys, zs = xs[skip:], ys[skip:], zs[skip:]
-        
-        # Create 3D trajectory
-        points = [axes.c2p(x, y, z) for x, y, z in zip(xs[::3], ys[::3], zs[::3])]
+        # Create 3D trajectory, thinned where it is nearly straight
+        points = decimate(c2p_batch(axes, np.column_stack([xs, ys, zs])))
         attractor = VMobject()
         attractor.set_points_smoothly(points)
         attractor.set_stroke(width=1)
@@ -1092,7 +1455,7 @@ class PoincareStrangeAttractorScene(ThreeDScene):
         self.add_fixed_in_frame_mobjects(plane_label)
         
         # Show plane first
-        self.play(FadeIn(poincare_plane), Write(plane_label), run_time=1.5)
+        self.play(FadeIn(poincare_plane), FadeIn(plane_label, shift=UP * 0.2), run_time=1.5)
         
         # Draw attractor with ambient rotation
         self.begin_ambient_camera_rotation(rate=0.1)
@@ -1102,10 +1465,11 @@ class PoincareStrangeAttractorScene(ThreeDScene):
         # --- COMPUTE AND SHOW CROSSINGS ---
         crossings = compute_rossler_poincare(xs, ys, zs, 'y', section_value, 'positive')
         
-        crossing_dots = VGroup()
-        for x, y, z in crossings[:200]:
-            dot = Dot3D(point=axes.c2p(x, y, z), color=YELLOW, radius=0.08)
-            crossing_dots.add(dot)
+        # Coarse spheres are plenty at this radius
+        crossing_dots = VGroup(*[
+            Dot3D(point=p, color=YELLOW, radius=0.08, resolution=(6, 6))
+            for p in c2p_batch(axes, crossings[:200])
+        ])
         
         crossing_label = Text(f"Crossings: {len(crossings[:200])} points", font_size=18, color=YELLOW)
         crossing_label.next_to(plane_label, DOWN, aligned_edge=LEFT)
@@ -1113,7 +1477,7 @@ class PoincareStrangeAttractorScene(ThreeDScene):
         
         self.play(
             FadeIn(crossing_dots, lag_ratio=0.01),
-            Write(crossing_label),
+            FadeIn(crossing_label, shift=UP * 0.2),
             run_time=3
         )
         
@@ -1127,7 +1491,7 @@ class PoincareStrangeAttractorScene(ThreeDScene):
         explanation = Text("Trajectory pierces plane → 2D pattern", font_size=18, color=WHITE)
         explanation.to_edge(DOWN)
         self.add_fixed_in_frame_mobjects(explanation)
-        self.play(Write(explanation))
+        self.play(FadeIn(explanation, shift=UP * 0.2))
         
         self.wait(2)
         
@@ -1159,18 +1523,18 @@ class PoincareStrangeAttractorScene(ThreeDScene):
         self.play(Create(map_axes), Write(map_labels), Write(map_title), run_time=1.5)
         
         # Plot Poincaré section points
-        section_dots = VGroup()
-        for x, y, z in crossings[:300]:
-            dot = Dot(point=map_axes.c2p(x, z), radius=0.03, color=BLUE)
-            section_dots.add(dot)
+        section_dots = VGroup(*[
+            make_dot_cloud(batch, radius=0.03, color=BLUE)
+            for batch in np.array_split(c2p_batch(map_axes, crossings[:300, [0, 2]]), 10)
+        ])
         
-        self.play(LaggedStartMap(FadeIn, section_dots, lag_ratio=0.005), run_time=4)
+        self.play(LaggedStartMap(FadeIn, section_dots, lag_ratio=0.15), run_time=4)
         
         # Show the characteristic curved structure
         structure_text = Text("Strange attractor → Fractal Poincaré section", font_size=20, color=YELLOW)
         structure_text.to_edge(DOWN)
         self.add_fixed_in_frame_mobjects(structure_text)
-        self.play(Write(structure_text))
+        self.play(FadeIn(structure_text, shift=UP * 0.2))
         
         self.wait(2)
         
@@ -1181,16 +1545,15 @@ class PoincareStrangeAttractorScene(ThreeDScene):
         
         # Draw arrows between consecutive crossings
         arrows = VGroup()
-        for i in range(min(20, len(crossings)-1)):
-            x1, _, z1 = crossings[i]
-            x2, _, z2 = crossings[i+1]
+        map_pts = c2p_batch(map_axes, crossings[:21, [0, 2]])
+        for start, end in zip(map_pts[:-1], map_pts[1:]):
             arrow = Arrow(
-                map_axes.c2p(x1, z1), map_axes.c2p(x2, z2),
+                start, end,
                 buff=0.08, stroke_width=1, color=RED, max_tip_length_to_length_ratio=0.15
             )
             arrows.add(arrow)
         
-        self.play(Write(return_text), run_time=0.5)
+        self.play(FadeIn(return_text, shift=UP * 0.2), run_time=0.5)
         self.play(LaggedStartMap(Create, arrows, lag_ratio=0.1), run_time=3)
         
         self.wait(2)
@@ -1200,6 +1563,15 @@ class PoincareStrangeAttractorScene(ThreeDScene):
 # Scene: Simple Pendulum - Classical ODE with Critical Points & Uniqueness
 # ---------------------------------------------------------------------------
 
+@njit(cache=True)
+def _pendulum_rhs(t, state, g_over_L, damping):
+    theta, omega = state[0], state[1]
+    out = np.empty(2)
+    out[0] = omega
+    out[1] = -g_over_L * np.sin(theta) - damping * omega
+    return out
+
+
 def pendulum_system(t, state, g_over_L=1.0, damping=0.0):
     """
     Simple pendulum ODE:
@@ -1208,20 +1580,71 @@ def pendulum_system(t, state, g_over_L=1.0, damping=0.0):
     
     State: [θ, ω] where θ = angle, ω = angular velocity
     """
-    theta, omega = state
-    return [omega, -g_over_L * np.sin(theta) - damping * omega]
+    return _pendulum_rhs(t, np.asarray(state, dtype=np.float64),
+                         float(g_over_L), float(damping))
+
+
+_pendulum_rhs(0.0, np.zeros(2), 1.0, 0.0)
+
+
+@njit(cache=True)
+def _rk4_pendulum(g_over_L, damping, state0, t0, dt, n_points, substeps):
+    """Fixed-step RK4, storing the state every `substeps` steps of dt/substeps."""
+    out = np.empty((2, n_points))
+    state = state0.copy()
+    out[:, 0] = state
+    h = dt / substeps
+    t = t0
+    for i in range(1, n_points):
+        for _ in range(substeps):
+            k1 = _pendulum_rhs(t, state, g_over_L, damping)
+            k2 = _pendulum_rhs(t + 0.5 * h, state + 0.5 * h * k1, g_over_L, damping)
+            k3 = _pendulum_rhs(t + 0.5 * h, state + 0.5 * h * k2, g_over_L, damping)
+            k4 = _pendulum_rhs(t + h, state + h * k3, g_over_L, damping)
+            state = state + (h / 6.0) * (k1 + 2.0 * k2 + 2.0 * k3 + k4)
+            t += h
+        out[:, i] = state
+    return out
+
+
+_rk4_pendulum(1.0, 0.0, np.zeros(2), 0.0, 0.01, 2, 1)
 
 
 def integrate_pendulum(g_over_L=1.0, damping=0.0, theta0=0.5, omega0=0.0,
                        t_span=(0, 30), n_points=2000):
-    """Integrate pendulum and return (theta, omega) arrays."""
-    sol = solve_ivp(pendulum_system, t_span, [theta0, omega0],
-                    args=(g_over_L, damping), dense_output=True, max_step=0.02)
+    """Integrate pendulum and return (theta, omega) arrays (fixed-step RK4, step <= 0.01)."""
     t_eval = np.linspace(*t_span, n_points)
-    state = sol.sol(t_eval)
+    dt = (t_span[1] - t_span[0]) / max(n_points - 1, 1)
+    substeps = max(int(np.ceil(abs(dt) / 0.01)), 1)
+    state = _rk4_pendulum(float(g_over_L), float(damping), np.array([theta0, omega0], dtype=np.float64),
+                          float(t_span[0]), dt, int(n_points), substeps)
     return state[0], state[1], t_eval
 
 
+@njit(cache=True)
+def _rk4_pendulum_batch(g_over_L, damping, states0, t0, dt, n_points, substeps):
+    out = np.empty((states0.shape[0], 2, n_points))
+    for k in range(states0.shape[0]):
+        out[k] = _rk4_pendulum(g_over_L, damping, states0[k], t0, dt, n_points, substeps)
+    return out
+
+
+_rk4_pendulum_batch(1.0, 0.0, np.zeros((1, 2)), 0.0, 0.01, 2, 1)
+
+
+def integrate_pendulum_batch(g_over_L=1.0, damping=0.0, starts=((0.5, 0.0),),
+                             t_span=(0, 30), n_points=2000):
+    """
+    Integrate several pendulum initial conditions in one jitted call.
+    `starts` is a sequence of (theta0, omega0); returns a (K, 2, n_points) array.
+    """
+    dt = (t_span[1] - t_span[0]) / max(n_points - 1, 1)
+    substeps = max(int(np.ceil(abs(dt) / 0.01)), 1)
+    return _rk4_pendulum_batch(float(g_over_L), float(damping),
+                               np.asarray(starts, dtype=np.float64).reshape(-1, 2),
+                               float(t_span[0]), dt, int(n_points), substeps)
+
+
 def pendulum_energy(theta, omega, g_over_L=1.0):
     """Total energy: E = ω²/2 - (g/L)*cos(θ)"""
     return 0.5 * omega**2 - g_over_L * np.cos(theta)
@@ -1275,7 +1698,7 @@ class PendulumDynamicsScene(Scene):
         # --- CRITICAL POINTS ---
         critical_title = Text("Critical Points", font_size=22, color=TEAL)
         critical_title.to_corner(UL)
-        self.play(Write(critical_title))
+        self.play(FadeIn(critical_title, shift=UP * 0.2))
         
         g_over_L = 1.0
         
@@ -1318,7 +1741,7 @@ class PendulumDynamicsScene(Scene):
         center_exp.to_corner(UR)
         saddle_exp.next_to(center_exp, DOWN, aligned_edge=RIGHT)
         
-        self.play(Write(center_exp), Write(saddle_exp))
+        self.play(FadeIn(center_exp, shift=UP * 0.2), FadeIn(saddle_exp, shift=UP * 0.2))
         self.wait(1)
         
         # --- PHASE PORTRAIT: Multiple trajectories ---
@@ -1328,16 +1751,17 @@ class PendulumDynamicsScene(Scene):
         
         trajectories = VGroup()
         
+        # Libration (E < 1) and rotation (E > 1) orbits, integrated together
+        # from θ=0 with the given energy: E = ω²/2 - cos(θ)
+        energies = np.array([0.3, 0.6, 0.9, 1.5, 2.5])
+        starts = np.column_stack([np.full(len(energies), 0.01), np.sqrt(2 * (energies + g_over_L))])
+        orbits = integrate_pendulum_batch(g_over_L=g_over_L, starts=starts,
+                                          t_span=(0, 15), n_points=1000)
+        
         # Closed orbits around center (libration - oscillating)
         libration_colors = [BLUE, BLUE_B, BLUE_C]
-        for i, E in enumerate([0.3, 0.6, 0.9]):
-            # Initial condition with given energy at θ=0
-            omega0 = np.sqrt(2 * (E + g_over_L))  # E = ω²/2 - cos(θ)
-            theta_arr, omega_arr, _ = integrate_pendulum(
-                g_over_L=g_over_L, theta0=0.01, omega0=omega0,
-                t_span=(0, 15), n_points=1000
-            )
-            pts = [axes.c2p(t, o) for t, o in zip(theta_arr, omega_arr)]
+        for i, (theta_arr, omega_arr) in enumerate(orbits[:3]):
+            pts = c2p_batch(axes, np.column_stack([theta_arr, omega_arr]))
             curve = VMobject().set_points_smoothly(pts).set_stroke(libration_colors[i], width=2)
             trajectories.add(curve)
         
@@ -1346,21 +1770,16 @@ class PendulumDynamicsScene(Scene):
         sep_omega_pos = np.sqrt(2 * g_over_L * (1 + np.cos(sep_theta)))
         sep_omega_neg = -sep_omega_pos
         
-        sep_pts_pos = [axes.c2p(t, o) for t, o in zip(sep_theta, sep_omega_pos)]
-        sep_pts_neg = [axes.c2p(t, o) for t, o in zip(sep_theta, sep_omega_neg)]
+        sep_pts_pos = c2p_batch(axes, np.column_stack([sep_theta, sep_omega_pos]))
+        sep_pts_neg = c2p_batch(axes, np.column_stack([sep_theta, sep_omega_neg]))
         
         separatrix_pos = VMobject().set_points_smoothly(sep_pts_pos).set_stroke(YELLOW, width=3)
         separatrix_neg = VMobject().set_points_smoothly(sep_pts_neg).set_stroke(YELLOW, width=3)
         
         # Rotation orbits (E > 1, pendulum goes over the top)
         rotation_colors = [PURPLE, PURPLE_B]
-        for i, E in enumerate([1.5, 2.5]):
-            omega0 = np.sqrt(2 * (E + g_over_L))
-            theta_arr, omega_arr, _ = integrate_pendulum(
-                g_over_L=g_over_L, theta0=0.01, omega0=omega0,
-                t_span=(0, 10), n_points=500
-            )
-            pts = [axes.c2p(t, o) for t, o in zip(theta_arr, omega_arr)]
+        for i, (theta_arr, omega_arr) in enumerate(orbits[3:, :, :667]):  # t <= 10
+            pts = c2p_batch(axes, np.column_stack([theta_arr, omega_arr]))
             curve = VMobject().set_points_smoothly(pts).set_stroke(rotation_colors[i], width=2)
             trajectories.add(curve)
         
@@ -1369,7 +1788,7 @@ class PendulumDynamicsScene(Scene):
         
         sep_label = Text("Separatrix (E = critical)", font_size=14, color=YELLOW)
         sep_label.next_to(saddle_exp, DOWN, aligned_edge=RIGHT)
-        self.play(Write(sep_label))
+        self.play(FadeIn(sep_label, shift=UP * 0.2))
         
         self.wait(1)
         
@@ -1380,7 +1799,7 @@ class PendulumDynamicsScene(Scene):
         
         unique_text = Text("Trajectories NEVER cross!", font_size=20, color=GOLD)
         unique_text.to_edge(DOWN)
-        self.play(Write(unique_text))
+        self.play(FadeIn(unique_text, shift=UP * 0.2))
         
         # Highlight a region to show non-crossing
         highlight_circle = Circle(radius=0.5, color=WHITE, stroke_width=2)
@@ -1394,7 +1813,7 @@ class PendulumDynamicsScene(Scene):
         
         picard_text = Text("Picard-Lindelöf: Lipschitz → unique solution", font_size=16, color=WHITE)
         picard_text.next_to(unique_text, UP)
-        self.play(Write(picard_text), FadeOut(highlight_circle))
+        self.play(FadeIn(picard_text, shift=UP * 0.2), FadeOut(highlight_circle))
         
         self.wait(2)
         
@@ -1416,7 +1835,7 @@ class PendulumDynamicsScene(Scene):
         poincare_label = Text("Section: θ = 0", font_size=16, color=TEAL)
         poincare_label.next_to(poincare_line, RIGHT, buff=0.2)
         
-        self.play(Create(poincare_line), Write(poincare_label))
+        self.play(Create(poincare_line), FadeIn(poincare_label, shift=UP * 0.2))
         
         # Mark crossings on the section (these are on ω axis)
         crossing_dots = VGroup()
@@ -1434,14 +1853,14 @@ class PendulumDynamicsScene(Scene):
         
         poincare_exp = Text("Periodic orbit → Fixed points on section", font_size=18, color=YELLOW)
         poincare_exp.to_edge(DOWN)
-        self.play(Write(poincare_exp))
+        self.play(FadeIn(poincare_exp, shift=UP * 0.2))
         
         self.wait(1)
         
         # --- COMPARISON: Regular vs Chaotic ---
         comparison = Text("NOT Chaotic: Closed orbits, predictable, integrable", font_size=18, color=GREEN)
         comparison.next_to(poincare_exp, UP)
-        self.play(Write(comparison))
+        self.play(FadeIn(comparison, shift=UP * 0.2))
         
         # Final summary
         self.wait(2)
@@ -1504,26 +1923,20 @@ class MuGrowthScene(Scene):
         )
         self.add(mu_display)
 
-        # Function to compute limit cycle for given μ
-        def get_limit_cycle_curve(mu_val):
-            if mu_val < 0.05:
-                mu_val = 0.05  # Avoid μ=0 (no limit cycle)
-            
-            # Integrate to reach limit cycle
-            sol = solve_ivp(van_der_pol, (0, 100), [0.1, 0.0],
-                           args=(mu_val,), dense_output=True, max_step=0.01)
-            # Extract last cycle
-            t_final = np.linspace(90, 100, 500)
-            xy = sol.sol(t_final)
-            
-            points = [axes.c2p(x, y) for x, y in zip(xy[0], xy[1])]
-            curve = VMobject()
-            curve.set_points_smoothly(points)
-            curve.set_stroke(color=BLUE, width=3)
-            return curve
+        # Limit cycles precomputed once on a μ grid; frames blend neighbours
+        mu_grid, cycles = compute_limit_cycle_family(0.05, 5.0, 60, 500)
+        cycle_pts = c2p_batch(axes, cycles.reshape(-1, 2)).reshape(len(mu_grid), -1, 3)
+
+        def get_limit_cycle_points(mu_val):
+            mu_val = min(max(mu_val, mu_grid[0]), mu_grid[-1])  # Avoid μ=0 (no limit cycle)
+            i = int(np.clip(np.searchsorted(mu_grid, mu_val), 1, len(mu_grid) - 1))
+            alpha = (mu_val - mu_grid[i - 1]) / (mu_grid[i] - mu_grid[i - 1])
+            return (1 - alpha) * cycle_pts[i - 1] + alpha * cycle_pts[i]
 
         # Initial curve
-        limit_cycle = get_limit_cycle_curve(0.1)
+        limit_cycle = VMobject()
+        limit_cycle.set_points_smoothly(get_limit_cycle_points(0.1))
+        limit_cycle.set_stroke(color=BLUE, width=3)
         self.play(Create(limit_cycle), run_time=2)
 
         # Equilibrium point (origin)
@@ -1534,8 +1947,7 @@ class MuGrowthScene(Scene):
 
         # Animate μ growth
         def update_curve(curve):
-            new_curve = get_limit_cycle_curve(mu_tracker.get_value())
-            curve.become(new_curve)
+            curve.set_points_smoothly(get_limit_cycle_points(mu_tracker.get_value()))
 
         limit_cycle.add_updater(update_curve)
 
@@ -1612,128 +2024,132 @@ class ParticleTrajectoryScene(Scene):
         
         self.play(Create(axes), Write(x_label), Write(y_label))
 
-        # Compute trajectory
+        # Compute trajectory, and every quantity the live displays show, once
         t_span = (0, 30)
         n_points = 3000
-        sol = solve_ivp(van_der_pol, t_span, [0.1, 0.0], args=(mu,),
-                       dense_output=True, max_step=0.01)
-        t_vals = np.linspace(*t_span, n_points)
-        trajectory = sol.sol(t_vals)
-        x_vals, y_vals = trajectory[0], trajectory[1]
+        x_vals, y_vals = integrate_van_der_pol(mu, 0.1, 0.0, t_span, n_points)
+        states = np.column_stack([x_vals, y_vals])
+        accels = mu * (1 - x_vals**2) * y_vals - x_vals  # ÿ = μ(1-x²)ẏ - x
+        energies = 0.5 * (x_vals**2 + y_vals**2)
+        damping_coeffs = mu * (1 - x_vals**2)
+        scene_pts = c2p_batch(axes, states)
 
         # Draw faded trajectory path
-        traj_points = [axes.c2p(x, y) for x, y in zip(x_vals, y_vals)]
-        traj_path = VMobject().set_points_smoothly(traj_points)
+        traj_path = VMobject().set_points_smoothly(scene_pts)
         traj_path.set_stroke(color=BLUE, width=1, opacity=0.3)
         self.play(Create(traj_path), run_time=2)
 
         # Time tracker
         time_tracker = ValueTracker(0)
         total_time = t_span[1]
+        idx_scale = (n_points - 1) / total_time
 
-        # Particle dot
-        def get_current_state(t):
-            idx = int((t / total_time) * (n_points - 1))
-            idx = min(max(idx, 0), n_points - 1)
-            return x_vals[idx], y_vals[idx]
+        def get_index(t):
+            return min(max(int(t * idx_scale), 0), n_points - 1)
 
-        particle = always_redraw(
-            lambda: Dot(
-                axes.c2p(*get_current_state(time_tracker.get_value())),
-                color=YELLOW,
-                radius=0.12
-            )
-        )
+        # The sample index for the current time, computed once per frame by
+        # an updater that runs before every state-consuming one below
+        current_idx = np.zeros(1, dtype=np.int64)
+
+        def update_index(mob):
+            current_idx[0] = get_index(time_tracker.get_value())
+
+        self.add(Mobject().add_updater(update_index))
+
+        def get_current_point():
+            return scene_pts[current_idx[0]]
+
+        # Particle dot
+        particle = Dot(scene_pts[0], color=YELLOW, radius=0.12)
+        particle.add_updater(lambda m: m.move_to(get_current_point()))
         
         # Glowing effect
-        particle_glow = always_redraw(
-            lambda: Dot(
-                axes.c2p(*get_current_state(time_tracker.get_value())),
-                color=YELLOW,
-                radius=0.2
-            ).set_fill(opacity=0.3)
-        )
+        particle_glow = Dot(scene_pts[0], color=YELLOW, radius=0.2).set_fill(opacity=0.3)
+        particle_glow.add_updater(lambda m: m.move_to(get_current_point()))
 
         self.play(FadeIn(particle_glow), FadeIn(particle))
 
-        # Trail (recent path)
-        trail = TracedPath(
-            lambda: axes.c2p(*get_current_state(time_tracker.get_value())),
-            stroke_color=YELLOW,
-            stroke_width=2,
-            stroke_opacity=[1, 0],  # Fading trail
-            dissipating_time=0.5,
-        )
-        self.add(trail)
+        # Trail (recent path): a sliding window of the precomputed points,
+        # about 0.5 s of the 20 s sweep below
+        trail_window = max(1, int(0.75 * idx_scale))
+        trail = VMobject().set_stroke(color=YELLOW, width=2, opacity=[1, 0])  # Fading trail
 
-        # Data panel on the right
-        data_panel = VGroup()
-        
-        def create_data_display():
-            t = time_tracker.get_value()
-            x, y = get_current_state(t)
-            
-            # Compute derived quantities
-            accel = mu * (1 - x**2) * y - x  # ÿ = μ(1-x²)ẏ - x
-            energy = 0.5 * (x**2 + y**2)
-            damping_coeff = mu * (1 - x**2)
-            damping_type = "Energy IN" if damping_coeff > 0 else "Energy OUT"
-            damping_color = RED if damping_coeff > 0 else GREEN
-            
-            panel = VGroup(
-                Text("─── Live Data ───", font_size=18, color=WHITE),
-                VGroup(
-                    Text("t = ", font_size=16),
-                    DecimalNumber(t, num_decimal_places=2, font_size=16, color=TEAL)
-                ).arrange(RIGHT, buff=0.1),
-                VGroup(
-                    Text("x = ", font_size=16),
-                    DecimalNumber(x, num_decimal_places=3, font_size=16, color=BLUE)
-                ).arrange(RIGHT, buff=0.1),
-                VGroup(
-                    Text("ẋ = ", font_size=16),
-                    DecimalNumber(y, num_decimal_places=3, font_size=16, color=PURPLE)
-                ).arrange(RIGHT, buff=0.1),
-                VGroup(
-                    Text("ẍ = ", font_size=16),
-                    DecimalNumber(accel, num_decimal_places=3, font_size=16, color=ORANGE)
-                ).arrange(RIGHT, buff=0.1),
-                Text("─────────────", font_size=14, color=GRAY),
-                VGroup(
-                    Text("E = ", font_size=16),
-                    DecimalNumber(energy, num_decimal_places=3, font_size=16, color=GOLD)
-                ).arrange(RIGHT, buff=0.1),
-                VGroup(
-                    Text("Damping: ", font_size=14),
-                    DecimalNumber(damping_coeff, num_decimal_places=2, font_size=14, color=damping_color)
-                ).arrange(RIGHT, buff=0.1),
-                Text(damping_type, font_size=14, color=damping_color),
-            )
-            panel.arrange(DOWN, aligned_edge=LEFT, buff=0.12)
-            panel.to_corner(UR).shift(DOWN * 0.5)
-            return panel
+        def update_trail(mob):
+            idx = current_idx[0]
+            if idx > 0:
+                mob.set_points_as_corners(scene_pts[max(0, idx - trail_window):idx + 1])
 
-        data_display = always_redraw(create_data_display)
-        self.add(data_display)
+        trail.add_updater(update_trail)
+        self.add(trail)
+
+        # Data panel on the right: built once, only the numbers change per frame
+        t_num = DecimalNumber(0, num_decimal_places=2, font_size=16, color=TEAL)
+        x_num = DecimalNumber(x_vals[0], num_decimal_places=3, font_size=16, color=BLUE)
+        y_num = DecimalNumber(y_vals[0], num_decimal_places=3, font_size=16, color=PURPLE)
+        a_num = DecimalNumber(accels[0], num_decimal_places=3, font_size=16, color=ORANGE)
+        e_num = DecimalNumber(energies[0], num_decimal_places=3, font_size=16, color=GOLD)
+        d_num = DecimalNumber(damping_coeffs[0], num_decimal_places=2, font_size=14)
+        energy_in = Text("Energy IN", font_size=14, color=RED)
+        energy_out = Text("Energy OUT", font_size=14, color=GREEN)
+
+        data_display = VGroup(
+            Text("─── Live Data ───", font_size=18, color=WHITE),
+            VGroup(Text("t = ", font_size=16), t_num).arrange(RIGHT, buff=0.1),
+            VGroup(Text("x = ", font_size=16), x_num).arrange(RIGHT, buff=0.1),
+            VGroup(Text("ẋ = ", font_size=16), y_num).arrange(RIGHT, buff=0.1),
+            VGroup(Text("ẍ = ", font_size=16), a_num).arrange(RIGHT, buff=0.1),
+            Text("─────────────", font_size=14, color=GRAY),
+            VGroup(Text("E = ", font_size=16), e_num).arrange(RIGHT, buff=0.1),
+            VGroup(Text("Damping: ", font_size=14), d_num).arrange(RIGHT, buff=0.1),
+            energy_in,
+        )
+        data_display.arrange(DOWN, aligned_edge=LEFT, buff=0.12)
+        data_display.to_corner(UR).shift(DOWN * 0.5)
+        energy_out.move_to(energy_in, aligned_edge=LEFT)
+        data_display.add(energy_out)
 
-        # Velocity vector
-        def get_velocity_arrow():
+        def update_data_display(panel):
             t = time_tracker.get_value()
-            x, y = get_current_state(t)
-            
-            # Velocity is (ẋ, ẍ) = (y, μ(1-x²)y - x)
-            vx = y
-            vy = mu * (1 - x**2) * y - x
-            
-            # Scale for visibility
-            scale = 0.15
-            start = axes.c2p(x, y)
-            end = axes.c2p(x + scale * vx, y + scale * vy)
-            
-            arrow = Arrow(start, end, buff=0, stroke_width=3, color=RED, max_tip_length_to_length_ratio=0.3)
-            return arrow
+            idx = current_idx[0]
+            pumping = damping_coeffs[idx] > 0
+            t_num.set_value(t)
+            x_num.set_value(x_vals[idx])
+            y_num.set_value(y_vals[idx])
+            a_num.set_value(accels[idx])
+            e_num.set_value(energies[idx])
+            d_num.set_value(damping_coeffs[idx])
+            d_num.set_color(RED if pumping else GREEN)
+            energy_in.set_opacity(1 if pumping else 0)
+            energy_out.set_opacity(0 if pumping else 1)
+
+        update_data_display(data_display)
+        data_display.add_updater(update_data_display)
+        self.add(data_display)
 
-        velocity_arrow = always_redraw(get_velocity_arrow)
+        # Velocity vector (ẋ, ẍ) = (y, μ(1-x²)y - x), scaled for visibility.
+        # One arrow is moved each frame; its tip and stroke are resized so it
+        # matches a freshly built Arrow of the same length.
+        arrow_ends = c2p_batch(axes, states + 0.15 * np.column_stack([y_vals, accels]))
+        tip_ratio = 0.3
+
+        velocity_arrow = Arrow(scene_pts[0], arrow_ends[0], buff=0, stroke_width=3, color=RED,
+                               max_tip_length_to_length_ratio=tip_ratio)
+
+        def update_velocity_arrow(mob):
+            idx = current_idx[0]
+            start, end = scene_pts[idx], arrow_ends[idx]
+            length = np.linalg.norm(end - start)
+            if length == 0:
+                return
+            tip = mob.pop_tips()[0]
+            mob.put_start_and_end_on(start, end)
+            tip.scale(min(DEFAULT_ARROW_TIP_LENGTH, tip_ratio * length) / tip.length)
+            mob.add_tip(tip=tip)
+            # add_tip sized the stroke from the shortened shaft; a fresh Arrow
+            # sizes it from the full length
+            mob.set_stroke(width=min(3, mob.max_stroke_width_to_length_ratio * length), family=False)
+
+        velocity_arrow.add_updater(update_velocity_arrow)
         self.add(velocity_arrow)
 
         # Legend
@@ -1746,14 +2162,24 @@ class ParticleTrajectoryScene(Scene):
         self.add(legend)
 
         # Region indicator (|x| < 1 vs |x| > 1)
-        region_indicator = always_redraw(
-            lambda: Text(
-                f"|x| = {abs(get_current_state(time_tracker.get_value())[0]):.2f}" + 
-                (" < 1 (pumping)" if abs(get_current_state(time_tracker.get_value())[0]) < 1 else " > 1 (damping)"),
-                font_size=16,
-                color=RED if abs(get_current_state(time_tracker.get_value())[0]) < 1 else GREEN
-            ).to_edge(DOWN)
-        )
+        abs_x_num = DecimalNumber(abs(x_vals[0]), num_decimal_places=2, font_size=16)
+        pumping_text = Text(" < 1 (pumping)", font_size=16)
+        damping_text = Text(" > 1 (damping)", font_size=16)
+        region_indicator = VGroup(Text("|x| = ", font_size=16), abs_x_num, pumping_text)
+        region_indicator.arrange(RIGHT, buff=0.1).to_edge(DOWN)
+        damping_text.move_to(pumping_text, aligned_edge=LEFT)
+        region_indicator.add(damping_text)
+
+        def update_region_indicator(indicator):
+            abs_x = abs(x_vals[current_idx[0]])
+            inside = abs_x < 1
+            abs_x_num.set_value(abs_x)
+            indicator.set_color(RED if inside else GREEN)
+            pumping_text.set_opacity(1 if inside else 0)
+            damping_text.set_opacity(0 if inside else 1)
+
+        update_region_indicator(region_indicator)
+        region_indicator.add_updater(update_region_indicator)
         self.add(region_indicator)
 
         # Animate the particle along trajectory
@@ -1768,6 +2194,7 @@ class ParticleTrajectoryScene(Scene):
         # Final message
         final_msg = Text("Limit cycle reached: self-sustained oscillation", font_size=20, color=GOLD)
         final_msg.to_edge(DOWN)
+        region_indicator.clear_updaters()
         self.play(Transform(region_indicator, final_msg))
 
         self.wait(2)
@@ -1807,6 +2234,25 @@ class LorenzRhoGrowthScene(ThreeDScene):
         labels = axes.get_axis_labels(x_label="x", y_label="y", z_label="z")
         self.add(axes, labels)
 
+        # Trajectories for several ρ, integrated together and mapped to
+        # scene coordinates; returns {ρ: (n_points, 3) scene points}
+        def compute_lorenz_points(rho_vals, t_span=(0, 30), n_points=5000):
+            # Start near origin but not exactly at it
+            trajs = integrate_lorenz_batch(rho_vals, sigma, beta, 1.0, 1.0, 1.0, t_span, n_points)
+            pts = c2p_batch(axes, trajs.transpose(0, 2, 1).reshape(-1, 3))
+            return dict(zip(rho_vals, pts.reshape(len(rho_vals), n_points, 3)))
+
+        # Precompute every trajectory the ρ schedule shows, once, up front
+        traj_cache = compute_lorenz_points([0.5, 0.99, 5, 10, 15, 20, 24])
+        traj_cache.update(compute_lorenz_points([26, 28], t_span=(0, 50), n_points=8000))
+
+        # Smooth each shown curve once, up front; the ρ steps only copy
+        # control points into one pooled target mobject
+        shown = {0.5: 1000, 0.99: 2000}
+        curve_pts = {rho_val: smooth_points(decimate(pts[:shown.get(rho_val, len(pts))]))
+                     for rho_val, pts in traj_cache.items()}
+        new_traj = VMobject()
+
         # Title
         title = Text("Lorenz Attractor: ρ Parameter Evolution", font_size=28, color=GOLD)
         title.to_edge(UP)
@@ -1825,54 +2271,37 @@ class LorenzRhoGrowthScene(ThreeDScene):
         )
         self.add_fixed_in_frame_mobjects(rho_display)
 
-        # Regime indicator
-        def get_regime_text():
-            rho = rho_tracker.get_value()
-            if rho < 1:
-                text = "Regime: Origin stable (no oscillation)"
-                color = GREEN
-            elif rho < 24.74:
-                text = "Regime: Two stable fixed points"
-                color = BLUE
-            else:
-                text = "Regime: STRANGE ATTRACTOR (chaos)"
-                color = RED
-            return Text(text, font_size=18, color=color).to_corner(UR).shift(DOWN * 0.5)
-
-        regime_display = always_redraw(get_regime_text)
-        self.add_fixed_in_frame_mobjects(regime_display)
+        # Regime indicator: one caption per regime, built once and shown
+        # by toggling opacity as ρ crosses 1 and 24.74
+        regime_display = VGroup(
+            Text("Regime: Origin stable (no oscillation)", font_size=18, color=GREEN),
+            Text("Regime: Two stable fixed points", font_size=18, color=BLUE),
+            Text("Regime: STRANGE ATTRACTOR (chaos)", font_size=18, color=RED),
+        )
+        for text in regime_display:
+            text.to_corner(UR).shift(DOWN * 0.5)
 
-        # Function to compute trajectory for current ρ
-        def compute_lorenz_trajectory(rho_val, t_span=(0, 30), n_points=5000):
-            """Integrate Lorenz system for given rho."""
-            def lorenz_rho(t, state):
-                x, y, z = state
-                return [
-                    sigma * (y - x),
-                    x * (rho_val - z) - y,
-                    x * y - beta * z
-                ]
-            
-            # Start near origin but not exactly at it
-            x0, y0, z0 = 1.0, 1.0, 1.0
-            
-            sol = solve_ivp(lorenz_rho, t_span, [x0, y0, z0],
-                            dense_output=True, max_step=0.01)
-            t_eval = np.linspace(*t_span, n_points)
-            xyz = sol.sol(t_eval)
-            return xyz[0], xyz[1], xyz[2]
+        def update_regime_display(mob):
+            regime = int(np.searchsorted([1, 24.74], rho_tracker.get_value(), side='right'))
+            for i, text in enumerate(mob):
+                text.set_opacity(1 if i == regime else 0)
+
+        update_regime_display(regime_display)
+        regime_display.add_updater(update_regime_display)
+        self.add_fixed_in_frame_mobjects(regime_display)
 
         # Initial trajectory
-        current_rho = rho_tracker.get_value()
-        xs, ys, zs = compute_lorenz_trajectory(current_rho)
-        points = [axes.c2p(x, y, z) for x, y, z in zip(xs, ys, zs)]
-        
         trajectory = VMobject()
-        trajectory.set_points_smoothly(points[:1000])
+        trajectory.set_points(curve_pts[rho_tracker.get_value()])
         trajectory.set_stroke(color=BLUE, width=2)
         self.add(trajectory)
 
-        # Equilibrium points display
+        # Equilibrium points display. The axes map is affine, so C± are
+        # placed from directions probed once here rather than per frame
+        origin_pt = axes.c2p(0, 0, 0)
+        diag_dir = axes.c2p(1, 1, 0) - origin_pt
+        z_dir = axes.c2p(0, 0, 1) - origin_pt
+
         def get_equilibria():
             """Compute and display equilibrium points for current rho."""
             rho = rho_tracker.get_value()
@@ -1880,7 +2309,7 @@ class LorenzRhoGrowthScene(ThreeDScene):
             equilibria = VGroup()
             
             # Origin is always an equilibrium
-            origin_dot = Dot3D(point=axes.c2p(0, 0, 0), color=RED, radius=0.15)
+            origin_dot = Dot3D(point=origin_pt, color=RED, radius=0.15)
             equilibria.add(origin_dot)
             
             # For rho > 1, two symmetric fixed points exist: C+ and C-
@@ -1889,8 +2318,10 @@ class LorenzRhoGrowthScene(ThreeDScene):
                 sqrt_val = np.sqrt(beta * (rho - 1))
                 z_eq = rho - 1
                 
-                c_plus = Dot3D(point=axes.c2p(sqrt_val, sqrt_val, z_eq), color=GREEN, radius=0.12)
-                c_minus = Dot3D(point=axes.c2p(-sqrt_val, -sqrt_val, z_eq), color=GREEN, radius=0.12)
+                c_plus_pt = origin_pt + sqrt_val * diag_dir + z_eq * z_dir
+                c_minus_pt = origin_pt - sqrt_val * diag_dir + z_eq * z_dir
+                c_plus = Dot3D(point=c_plus_pt, color=GREEN, radius=0.12)
+                c_minus = Dot3D(point=c_minus_pt, color=GREEN, radius=0.12)
                 equilibria.add(c_plus, c_minus)
             
             return equilibria
@@ -1907,9 +2338,7 @@ class LorenzRhoGrowthScene(ThreeDScene):
         self.play(rho_tracker.animate.set_value(0.99), run_time=3, rate_func=smooth)
         
         # Update trajectory
-        xs, ys, zs = compute_lorenz_trajectory(0.99)
-        new_points = [axes.c2p(x, y, z) for x, y, z in zip(xs, ys, zs)]
-        new_traj = VMobject().set_points_smoothly(new_points[:2000]).set_stroke(color=BLUE, width=2)
+        new_traj.set_points(curve_pts[0.99]).set_stroke(color=BLUE, width=2)
         self.play(Transform(trajectory, new_traj), run_time=2)
 
         self.play(FadeOut(phase1_text))
@@ -1924,9 +2353,7 @@ class LorenzRhoGrowthScene(ThreeDScene):
         for rho_val in [5, 10, 15, 20, 24]:
             self.play(rho_tracker.animate.set_value(rho_val), run_time=2, rate_func=smooth)
             
-            xs, ys, zs = compute_lorenz_trajectory(rho_val)
-            new_points = [axes.c2p(x, y, z) for x, y, z in zip(xs, ys, zs)]
-            new_traj = VMobject().set_points_smoothly(new_points).set_stroke(color=BLUE, width=2)
+            new_traj.set_points(curve_pts[rho_val]).set_stroke(color=BLUE, width=2)
             self.play(Transform(trajectory, new_traj), run_time=1.5)
         
         self.play(FadeOut(phase2_text))
@@ -1951,9 +2378,7 @@ class LorenzRhoGrowthScene(ThreeDScene):
         for rho_val in [26, 28]:
             self.play(rho_tracker.animate.set_value(rho_val), run_time=2)
             
-            xs, ys, zs = compute_lorenz_trajectory(rho_val, t_span=(0, 50), n_points=8000)
-            new_points = [axes.c2p(x, y, z) for x, y, z in zip(xs, ys, zs)]
-            new_traj = VMobject().set_points_smoothly(new_points)
+            new_traj.set_points(curve_pts[rho_val])
             
             # Color gradient for chaotic trajectory
             new_traj.set_stroke(width=1.5)
@@ -2028,19 +2453,12 @@ class LorenzParticleScene(ThreeDScene):
         n_points = 8000
         t_span = (0, total_time)
         
-        sol = solve_ivp(
-            lambda t, state: lorenz(t, state, sigma, rho, beta),
-            t_span, [1.0, 1.0, 1.0],
-            dense_output=True, max_step=0.005
-        )
-        t_dense = np.linspace(0, total_time, n_points)
-        trajectory_data = sol.sol(t_dense)
+        trajectory_data = np.array(integrate_lorenz(sigma, rho, beta, 1.0, 1.0, 1.0, t_span, n_points))
 
-        # Draw faint attractor shape first
-        attractor_points = [axes.c2p(x, y, z) for x, y, z in 
-                           zip(trajectory_data[0], trajectory_data[1], trajectory_data[2])]
+        # Draw faint attractor shape first (scene points reused by the trail)
+        attractor_points = c2p_batch(axes, trajectory_data.T)
         attractor_curve = VMobject()
-        attractor_curve.set_points_smoothly(attractor_points)
+        attractor_curve.set_points_smoothly(decimate(attractor_points))
         attractor_curve.set_stroke(color=GRAY, width=0.5, opacity=0.3)
         self.play(Create(attractor_curve), run_time=3)
 
@@ -2057,29 +2475,28 @@ class LorenzParticleScene(ThreeDScene):
         # Time tracker
         time_tracker = ValueTracker(0)
 
-        def get_current_state(t):
-            """Get interpolated state at time t."""
-            idx = int(t / total_time * (n_points - 1))
-            idx = np.clip(idx, 0, n_points - 1)
-            return trajectory_data[0][idx], trajectory_data[1][idx], trajectory_data[2][idx]
+        idx_scale = (n_points - 1) / total_time
 
-        def get_velocity(x, y, z):
-            """Compute velocity at given point."""
-            dx = sigma * (y - x)
-            dy = x * (rho - z) - y
-            dz = x * y - beta * z
-            return dx, dy, dz
+        def get_index(t):
+            return min(max(int(t * idx_scale), 0), n_points - 1)
+
+        # The sample index for the current time, computed once per frame by
+        # an updater that runs before every state-consuming one below
+        current_idx = np.zeros(1, dtype=np.int64)
+
+        def update_index(mob):
+            current_idx[0] = get_index(time_tracker.get_value())
+
+        self.add(Mobject().add_updater(update_index))
 
         # Particle
         def get_particle():
-            t = time_tracker.get_value()
-            x, y, z = get_current_state(t)
+            idx = current_idx[0]
             
             # Color based on which "wing" (sign of x)
-            color = BLUE if x > 0 else ORANGE
+            color = BLUE if trajectory_data[0, idx] > 0 else ORANGE
             
-            pos = axes.c2p(x, y, z)
-            return Dot3D(point=pos, color=color, radius=0.15)
+            return Dot3D(point=attractor_points[idx], color=color, radius=0.15)
 
         particle = always_redraw(get_particle)
         self.add(particle)
@@ -2089,108 +2506,104 @@ class LorenzParticleScene(ThreeDScene):
         trail.set_stroke(width=2)
 
         def update_trail(mob):
-            t = time_tracker.get_value()
-            n_trail = int(t / total_time * n_points)
-            n_trail = min(n_trail, n_points - 1)
-            
+            n_trail = current_idx[0]
             if n_trail > 10:
-                trail_points = [axes.c2p(trajectory_data[0][i], trajectory_data[1][i], trajectory_data[2][i])
-                               for i in range(max(0, n_trail - 500), n_trail)]
-                mob.set_points_smoothly(trail_points)
+                mob.set_points_smoothly(attractor_points[max(0, n_trail - 500):n_trail])
                 mob.set_color_by_gradient(BLUE, PURPLE, RED)
 
         trail.add_updater(update_trail)
         self.add(trail)
 
-        # Data display panel
-        def create_data_display():
-            t = time_tracker.get_value()
-            x, y, z = get_current_state(t)
-            dx, dy, dz = get_velocity(x, y, z)
-            
-            speed = np.sqrt(dx**2 + dy**2 + dz**2)
-            
-            # Distance to equilibrium points
-            dist_C_plus = np.sqrt((x - C_plus[0])**2 + (y - C_plus[1])**2 + (z - C_plus[2])**2)
-            dist_C_minus = np.sqrt((x - C_minus[0])**2 + (y - C_minus[1])**2 + (z - C_minus[2])**2)
-            
-            # Current wing
-            wing = "Right (C+)" if x > 0 else "Left (C-)"
-            wing_color = BLUE if x > 0 else ORANGE
-            
-            # Local divergence indicator (trace of Jacobian)
-            # For Lorenz: div(F) = -σ - 1 - β < 0 (always contracting in volume)
-            divergence = -sigma - 1 - beta  # ≈ -13.67
-            
-            panel = VGroup(
-                Text("═══ Particle Data ═══", font_size=14, color=GOLD),
-                VGroup(
-                    Text(f"x = ", font_size=14),
-                    DecimalNumber(x, num_decimal_places=2, font_size=14, color=WHITE)
-                ).arrange(RIGHT, buff=0.05),
-                VGroup(
-                    Text(f"y = ", font_size=14),
-                    DecimalNumber(y, num_decimal_places=2, font_size=14, color=WHITE)
-                ).arrange(RIGHT, buff=0.05),
-                VGroup(
-                    Text(f"z = ", font_size=14),
-                    DecimalNumber(z, num_decimal_places=2, font_size=14, color=WHITE)
-                ).arrange(RIGHT, buff=0.05),
-                Text("───────────", font_size=12, color=GRAY),
-                VGroup(
-                    Text("|v| = ", font_size=14),
-                    DecimalNumber(speed, num_decimal_places=1, font_size=14, color=YELLOW)
-                ).arrange(RIGHT, buff=0.05),
-                Text("───────────", font_size=12, color=GRAY),
-                VGroup(
-                    Text("d(C+) = ", font_size=12),
-                    DecimalNumber(dist_C_plus, num_decimal_places=1, font_size=12, color=GREEN)
-                ).arrange(RIGHT, buff=0.05),
-                VGroup(
-                    Text("d(C-) = ", font_size=12),
-                    DecimalNumber(dist_C_minus, num_decimal_places=1, font_size=12, color=GREEN)
-                ).arrange(RIGHT, buff=0.05),
-                Text("───────────", font_size=12, color=GRAY),
-                Text(f"Wing: {wing}", font_size=14, color=wing_color),
-                Text("───────────", font_size=12, color=GRAY),
-                VGroup(
-                    Text("div(F) = ", font_size=12),
-                    DecimalNumber(divergence, num_decimal_places=2, font_size=12, color=RED)
-                ).arrange(RIGHT, buff=0.05),
-                Text("(volume contracting)", font_size=10, color=RED),
-            )
-            panel.arrange(DOWN, aligned_edge=LEFT, buff=0.08)
-            panel.to_corner(UR).shift(DOWN * 0.3)
-            return panel
-
-        data_display = always_redraw(create_data_display)
+        # Data display panel: built once, only the values change per frame
+        vel = lorenz_velocity(trajectory_data, float(sigma), float(rho), float(beta))
+        speeds = np.sqrt((vel**2).sum(axis=0))
+        # Distance to equilibrium points
+        dists_C_plus = np.sqrt(((trajectory_data - C_plus[:, None])**2).sum(axis=0))
+        dists_C_minus = np.sqrt(((trajectory_data - C_minus[:, None])**2).sum(axis=0))
+        
+        # Local divergence indicator (trace of Jacobian)
+        # For Lorenz: div(F) = -σ - 1 - β < 0 (always contracting in volume)
+        divergence = -sigma - 1 - beta  # ≈ -13.67
+        
+        x_num = DecimalNumber(trajectory_data[0, 0], num_decimal_places=2, font_size=14, color=WHITE)
+        y_num = DecimalNumber(trajectory_data[1, 0], num_decimal_places=2, font_size=14, color=WHITE)
+        z_num = DecimalNumber(trajectory_data[2, 0], num_decimal_places=2, font_size=14, color=WHITE)
+        speed_num = DecimalNumber(speeds[0], num_decimal_places=1, font_size=14, color=YELLOW)
+        dcp_num = DecimalNumber(dists_C_plus[0], num_decimal_places=1, font_size=12, color=GREEN)
+        dcm_num = DecimalNumber(dists_C_minus[0], num_decimal_places=1, font_size=12, color=GREEN)
+        # Current wing: both captions prebuilt, the updater shows one of them
+        wing_right = Text("Wing: Right (C+)", font_size=14, color=BLUE)
+        wing_left = Text("Wing: Left (C-)", font_size=14, color=ORANGE)
+        
+        data_display = VGroup(
+            Text("═══ Particle Data ═══", font_size=14, color=GOLD),
+            VGroup(Text("x = ", font_size=14), x_num).arrange(RIGHT, buff=0.05),
+            VGroup(Text("y = ", font_size=14), y_num).arrange(RIGHT, buff=0.05),
+            VGroup(Text("z = ", font_size=14), z_num).arrange(RIGHT, buff=0.05),
+            Text("───────────", font_size=12, color=GRAY),
+            VGroup(Text("|v| = ", font_size=14), speed_num).arrange(RIGHT, buff=0.05),
+            Text("───────────", font_size=12, color=GRAY),
+            VGroup(Text("d(C+) = ", font_size=12), dcp_num).arrange(RIGHT, buff=0.05),
+            VGroup(Text("d(C-) = ", font_size=12), dcm_num).arrange(RIGHT, buff=0.05),
+            Text("───────────", font_size=12, color=GRAY),
+            wing_right,
+            Text("───────────", font_size=12, color=GRAY),
+            VGroup(
+                Text("div(F) = ", font_size=12),
+                DecimalNumber(divergence, num_decimal_places=2, font_size=12, color=RED)
+            ).arrange(RIGHT, buff=0.05),
+            Text("(volume contracting)", font_size=10, color=RED),
+        )
+        data_display.arrange(DOWN, aligned_edge=LEFT, buff=0.08)
+        data_display.to_corner(UR).shift(DOWN * 0.3)
+        wing_left.move_to(wing_right, aligned_edge=LEFT)
+        data_display.add(wing_left)
+
+        # set_value rebuilds a number's digit submobjects, and the camera only
+        # keeps mobjects it was told about out of the 3D projection, so the
+        # numbers are re-registered as fixed in frame after every update
+        panel_numbers = (x_num, y_num, z_num, speed_num, dcp_num, dcm_num)
+
+        def update_data_display(panel):
+            idx = current_idx[0]
+            self.camera.remove_fixed_in_frame_mobjects(*panel_numbers)
+            x_num.set_value(trajectory_data[0, idx])
+            y_num.set_value(trajectory_data[1, idx])
+            z_num.set_value(trajectory_data[2, idx])
+            speed_num.set_value(speeds[idx])
+            dcp_num.set_value(dists_C_plus[idx])
+            dcm_num.set_value(dists_C_minus[idx])
+            self.camera.add_fixed_in_frame_mobjects(*panel_numbers)
+            right = trajectory_data[0, idx] > 0
+            wing_right.set_opacity(1 if right else 0)
+            wing_left.set_opacity(0 if right else 1)
+
+        update_data_display(data_display)
+        data_display.add_updater(update_data_display)
         self.add_fixed_in_frame_mobjects(data_display)
 
-        # Wing switching counter
-        switch_count = ValueTracker(0)
-        last_sign = [1]  # Mutable for closure
-
-        def count_switches(dt):
-            t = time_tracker.get_value()
-            x, _, _ = get_current_state(t)
-            current_sign = 1 if x > 0 else -1
-            if current_sign != last_sign[0]:
-                switch_count.increment_value(1)
-                last_sign[0] = current_sign
+        # Wing switching counter: cumulative count of sign changes of x,
+        # precomputed for every sample (the count starts on the right wing)
+        signs = np.where(trajectory_data[0] > 0, 1, -1)
+        switches_cum = np.cumsum(np.concatenate([[signs[0] != 1], signs[1:] != signs[:-1]]))
 
         # Switch counter display
-        switch_display = always_redraw(
-            lambda: VGroup(
-                Text("Wing Switches: ", font_size=16),
-                Integer(int(switch_count.get_value()), font_size=16, color=YELLOW)
-            ).arrange(RIGHT, buff=0.1).to_corner(DL).shift(UP * 0.5)
-        )
+        switch_num = Integer(0, font_size=16, color=YELLOW)
+        switch_display = VGroup(Text("Wing Switches: ", font_size=16), switch_num)
+        switch_display.arrange(RIGHT, buff=0.1).to_corner(DL).shift(UP * 0.5)
+
+        def update_switch_num(mob):
+            # Same re-registration as the data panel: set_value rebuilds the digits
+            self.camera.remove_fixed_in_frame_mobjects(mob)
+            mob.set_value(int(switches_cum[current_idx[0]]))
+            self.camera.add_fixed_in_frame_mobjects(mob)
+
+        switch_num.add_updater(update_switch_num)
         self.add_fixed_in_frame_mobjects(switch_display)
 
         # Animate particle
         self.play(
             time_tracker.animate.set_value(total_time),
-            UpdateFromFunc(switch_count, count_switches),
             run_time=30,
             rate_func=linear
         )
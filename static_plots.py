@@ -5,28 +5,183 @@ Quick matplotlib helpers for Van der Pol, limit cycles, and strange attractors.
 Import these in the Jupyter notebook for inline static figures.
 """
 
+import functools
+
 import numpy as np
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D  # noqa: F401
-from scipy.integrate import solve_ivp
+from numba import njit
+
+from caching import disk_cache
 
 # ---------------------------------------------------------------------------
 # ODEs
 # ---------------------------------------------------------------------------
 
+@njit(cache=True)
+def _van_der_pol_rhs(t, state, mu):
+    x, y = state[0], state[1]
+    out = np.empty(2)
+    out[0] = y
+    out[1] = mu * (1 - x * x) * y - x
+    return out
+
+
+@njit(cache=True)
+def _lorenz_rhs(t, state, sigma, rho, beta):
+    x, y, z = state[0], state[1], state[2]
+    out = np.empty(3)
+    out[0] = sigma * (y - x)
+    out[1] = x * (rho - z) - y
+    out[2] = x * y - beta * z
+    return out
+
+
+@njit(cache=True)
+def _rossler_rhs(t, state, a, b, c):
+    x, y, z = state[0], state[1], state[2]
+    out = np.empty(3)
+    out[0] = -y - z
+    out[1] = x + a * y
+    out[2] = b + z * (x - c)
+    return out
+
+
 def van_der_pol(t, state, mu=1.0):
-    x, y = state
-    return [y, mu * (1 - x**2) * y - x]
+    return _van_der_pol_rhs(t, np.asarray(state, dtype=np.float64), float(mu))
 
 
 def lorenz(t, state, sigma=10.0, rho=28.0, beta=8/3):
-    x, y, z = state
-    return [sigma * (y - x), x * (rho - z) - y, x * y - beta * z]
+    return _lorenz_rhs(t, np.asarray(state, dtype=np.float64),
+                       float(sigma), float(rho), float(beta))
 
 
 def rossler(t, state, a=0.2, b=0.2, c=5.7):
-    x, y, z = state
-    return [-y - z, x + a * y, b + z * (x - c)]
+    return _rossler_rhs(t, np.asarray(state, dtype=np.float64),
+                        float(a), float(b), float(c))
+
+
+# ---------------------------------------------------------------------------
+# Fixed-step RK4 integrators
+# ---------------------------------------------------------------------------
+# Each kernel returns a (d, n_points) array sampled every dt, taking each
+# output interval in `substeps` RK4 steps.
+
+@njit(cache=True, fastmath=True)
+def _rk4_van_der_pol(mu, state0, t0, dt, n_points, substeps):
+    out = np.empty((2, n_points))
+    state = state0.copy()
+    out[:, 0] = state
+    h = dt / substeps
+    t = t0
+    for i in range(1, n_points):
+        for _ in range(substeps):
+            k1 = _van_der_pol_rhs(t, state, mu)
+            k2 = _van_der_pol_rhs(t + 0.5 * h, state + 0.5 * h * k1, mu)
+            k3 = _van_der_pol_rhs(t + 0.5 * h, state + 0.5 * h * k2, mu)
+            k4 = _van_der_pol_rhs(t + h, state + h * k3, mu)
+            state = state + (h / 6.0) * (k1 + 2.0 * k2 + 2.0 * k3 + k4)
+            t += h
+        out[:, i] = state
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def _rk4_lorenz(sigma, rho, beta, state0, t0, dt, n_points, substeps):
+    out = np.empty((3, n_points))
+    state = state0.copy()
+    out[:, 0] = state
+    h = dt / substeps
+    t = t0
+    for i in range(1, n_points):
+        for _ in range(substeps):
+            k1 = _lorenz_rhs(t, state, sigma, rho, beta)
+            k2 = _lorenz_rhs(t + 0.5 * h, state + 0.5 * h * k1, sigma, rho, beta)
+            k3 = _lorenz_rhs(t + 0.5 * h, state + 0.5 * h * k2, sigma, rho, beta)
+            k4 = _lorenz_rhs(t + h, state + h * k3, sigma, rho, beta)
+            state = state + (h / 6.0) * (k1 + 2.0 * k2 + 2.0 * k3 + k4)
+            t += h
+        out[:, i] = state
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def _rk4_rossler(a, b, c, state0, t0, dt, n_points, substeps):
+    out = np.empty((3, n_points))
+    state = state0.copy()
+    out[:, 0] = state
+    h = dt / substeps
+    t = t0
+    for i in range(1, n_points):
+        for _ in range(substeps):
+            k1 = _rossler_rhs(t, state, a, b, c)
+            k2 = _rossler_rhs(t + 0.5 * h, state + 0.5 * h * k1, a, b, c)
+            k3 = _rossler_rhs(t + 0.5 * h, state + 0.5 * h * k2, a, b, c)
+            k4 = _rossler_rhs(t + h, state + h * k3, a, b, c)
+            state = state + (h / 6.0) * (k1 + 2.0 * k2 + 2.0 * k3 + k4)
+            t += h
+        out[:, i] = state
+    return out
+
+
+def _rk4_grid(t_span, n_points, max_step=0.01):
+    """Output spacing and number of RK4 substeps keeping the step <= max_step."""
+    dt = (t_span[1] - t_span[0]) / max(n_points - 1, 1)
+    return dt, max(int(np.ceil(abs(dt) / max_step)), 1)
+
+
+@functools.lru_cache(maxsize=64)
+@disk_cache("van_der_pol", mmap=True)
+def _van_der_pol_trajectory(mu, state0, t_span, n_points):
+    dt, substeps = _rk4_grid(t_span, n_points)
+    return _rk4_van_der_pol(mu, np.array(state0), t_span[0], dt, n_points, substeps)
+
+
+@functools.lru_cache(maxsize=64)
+@disk_cache("lorenz", mmap=True)
+def _lorenz_trajectory(sigma, rho, beta, state0, t_span, n_points):
+    dt, substeps = _rk4_grid(t_span, n_points)
+    return _rk4_lorenz(sigma, rho, beta, np.array(state0), t_span[0], dt, n_points, substeps)
+
+
+@functools.lru_cache(maxsize=64)
+@disk_cache("rossler", mmap=True)
+def _rossler_trajectory(a, b, c, state0, t_span, n_points):
+    dt, substeps = _rk4_grid(t_span, n_points)
+    return _rk4_rossler(a, b, c, np.array(state0), t_span[0], dt, n_points, substeps)
+
+
+def _as_key(values):
+    """Float tuple usable as an lru_cache key."""
+    return tuple(float(v) for v in values)
+
+
+def integrate_van_der_pol(mu=2.0, state0=(0.1, 0.0), t_span=(0, 40), n_points=2000):
+    """
+    Van der Pol trajectory as a (2, n_points) array on linspace(*t_span, n_points)
+    (memoized, read-only).
+    """
+    return _van_der_pol_trajectory(float(mu), _as_key(state0), _as_key(t_span), int(n_points))
+
+
+def integrate_lorenz(sigma=10.0, rho=28.0, beta=8/3, state0=(1.0, 1.0, 1.0),
+                     t_span=(0, 50), n_points=10000):
+    """
+    Lorenz trajectory as a (3, n_points) array on linspace(*t_span, n_points)
+    (memoized, read-only).
+    """
+    return _lorenz_trajectory(float(sigma), float(rho), float(beta),
+                              _as_key(state0), _as_key(t_span), int(n_points))
+
+
+def integrate_rossler(a=0.2, b=0.2, c=5.7, state0=(1.0, 1.0, 1.0),
+                      t_span=(0, 200), n_points=20000):
+    """
+    Rössler trajectory as a (3, n_points) array on linspace(*t_span, n_points)
+    (memoized, read-only).
+    """
+    return _rossler_trajectory(float(a), float(b), float(c),
+                               _as_key(state0), _as_key(t_span), int(n_points))
 
 
 # ---------------------------------------------------------------------------
@@ -35,10 +190,7 @@ def rossler(t, state, a=0.2, b=0.2, c=5.7):
 
 def plot_van_der_pol_phase(mu=2.0, t_span=(0, 40), n_points=2000, ax=None):
     """Plot Van der Pol phase portrait (x vs dx/dt)."""
-    sol = solve_ivp(van_der_pol, t_span, [0.1, 0.0], args=(mu,),
-                    dense_output=True, max_step=0.01)
-    t_eval = np.linspace(*t_span, n_points)
-    xy = sol.sol(t_eval)
+    xy = integrate_van_der_pol(mu, (0.1, 0.0), t_span, n_points)
 
     if ax is None:
         fig, ax = plt.subplots(figsize=(6, 5))
@@ -51,12 +203,9 @@ def plot_van_der_pol_phase(mu=2.0, t_span=(0, 40), n_points=2000, ax=None):
     return ax
 
 
-def plot_lorenz_3d(t_span=(0, 50), n_points=10000, ax=None):
+def plot_lorenz_3d(t_span=(0, 50), n_points=4000, ax=None):
     """Plot Lorenz attractor in 3D."""
-    sol = solve_ivp(lorenz, t_span, [1.0, 1.0, 1.0],
-                    dense_output=True, max_step=0.01)
-    t_eval = np.linspace(*t_span, n_points)
-    xyz = sol.sol(t_eval)
+    xyz = integrate_lorenz(state0=(1.0, 1.0, 1.0), t_span=t_span, n_points=n_points)
 
     if ax is None:
         fig = plt.figure(figsize=(8, 6))
@@ -69,12 +218,9 @@ def plot_lorenz_3d(t_span=(0, 50), n_points=10000, ax=None):
     return ax
 
 
-def plot_rossler_3d(t_span=(0, 200), n_points=20000, ax=None):
+def plot_rossler_3d(t_span=(0, 200), n_points=4000, ax=None):
     """Plot Rössler attractor in 3D."""
-    sol = solve_ivp(rossler, t_span, [1.0, 1.0, 1.0],
-                    dense_output=True, max_step=0.01)
-    t_eval = np.linspace(*t_span, n_points)
-    xyz = sol.sol(t_eval)
+    xyz = integrate_rossler(state0=(1.0, 1.0, 1.0), t_span=t_span, n_points=n_points)
 
     if ax is None:
         fig = plt.figure(figsize=(8, 6))